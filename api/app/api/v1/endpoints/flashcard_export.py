@@ -5,14 +5,17 @@ Flashcard PDF export endpoint.
 # pyright: reportCallIssue=false
 # pyright: reportArgumentType=false
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import load_only
 from sqlmodel import Session, select
 from io import BytesIO
+from typing import Iterator, List, Optional, Tuple
 from reportlab.lib.pagesizes import A4
 from reportlab.pdfgen import canvas
 
-from app.core.database import get_session
+from app.core.database import get_readonly_session
 from app.models.models import Concept, Lemma, Topic
+from app.models.concept_topic import ConceptTopic
 from app.schemas.flashcard import FlashcardExportRequest
 import logging
 
@@ -21,78 +24,29 @@ from app.services.flashcard_pdf_layout_service import (
     generate_pdf_a4_layout,
     get_page_format,
 )
+from app.services.flashcard_service import prefetch_images
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/flashcard-export", tags=["flashcard-export"])
 
+_STREAM_CHUNK_SIZE = 64 * 1024
 
-@router.post("/pdf")
-async def export_flashcards_pdf(
-    request: FlashcardExportRequest,
-    session: Session = Depends(get_session)
-):
-    """
-    Export flashcards as PDF.
-    Each concept gets front and back sides on separate pages.
-    Page format is determined by the 'layout' parameter ('a4', 'a5', or 'a6').
-    """
-    if not request.concept_ids:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="concept_ids cannot be empty"
-        )
-    
-    # Validate languages are provided if any text-related fields are enabled
-    if (request.include_text_front or request.include_ipa_front or request.include_description_front) and not request.languages_front:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="languages_front cannot be empty when text, IPA, or description is enabled on front side"
-        )
-    
-    if (request.include_text_back or request.include_ipa_back or request.include_description_back) and not request.languages_back:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="languages_back cannot be empty when text, IPA, or description is enabled on back side"
-        )
-    
-    
-    # Fetch all concepts with their lemmas and topics
-    concepts = []
-    for concept_id in request.concept_ids:
-        concept = session.get(Concept, concept_id)
-        if not concept:
-            logger.warning("Concept %d not found, skipping", concept_id)
-            continue
-        
-        # Get ALL lemmas for this concept (no limit, no pagination - we need every single one)
-        # Explicitly avoid any limits by using .all() which returns all results
-        statement = select(Lemma).where(Lemma.concept_id == concept_id)
-        # Execute without any offset/limit to ensure we get all results
-        lemmas = list(session.exec(statement).all())
-        logger.info("Loaded %d lemmas for concept %d (IDs: %s)", 
-                   len(lemmas), concept_id, 
-                   [l.id for l in lemmas[:10]] + (["..."] if len(lemmas) > 10 else []))
-        
-        # Get topic if available (use first topic from ConceptTopic)
-        topic = None
-        from app.models.concept_topic import ConceptTopic
-        concept_topic = session.exec(
-            select(ConceptTopic).where(ConceptTopic.concept_id == concept.id).limit(1)
-        ).first()
-        if concept_topic:
-            topic = session.get(Topic, concept_topic.topic_id)
-        
-        concepts.append((concept, lemmas, topic))
-    
-    if not concepts:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="No valid concepts found"
-        )
-    
-    logger.info("Exporting %d concepts to PDF with format: %s (fit_to_a4: %s)", 
-                len(concepts), request.layout, request.fit_to_a4)
+# The only lemma columns the card drawing reads; the rest of each row is never loaded
+_CARD_LEMMA_COLUMNS = (Lemma.concept_id, Lemma.language_code, Lemma.term, Lemma.ipa, Lemma.description)
+
+
+def _iter_buffer(buffer: BytesIO) -> Iterator[bytes]:
+    """Yield the buffer's remaining contents in chunks."""
+    while chunk := buffer.read(_STREAM_CHUNK_SIZE):
+        yield chunk
+
+
+def _render_pdf(concepts: List[Tuple[Concept, List[Lemma], Optional[Topic]]], request: FlashcardExportRequest) -> BytesIO:
+    """Render the flashcards PDF into a buffer positioned at its start."""
+    # Download remote images in parallel up front instead of one by one while drawing
+    if request.include_image_front or request.include_image_back:
+        prefetch_images(concept.image_url for concept, _, _ in concepts if concept.image_url)
     
     # Get page format from layout string
     pagesize = get_page_format(request.layout)
@@ -101,10 +55,7 @@ async def export_flashcards_pdf(
     buffer = BytesIO()
     if request.fit_to_a4 and request.layout.lower() in ['a6', 'a8']:
         # Use A4 pagesize when fitting cards to A4
-        c = canvas.Canvas(buffer, pagesize=A4)
-        
-        # Get card format (A6 or A8)
-        card_format = get_page_format(request.layout)
+        c = canvas.Canvas(buffer, pagesize=A4, pageCompression=1)
         
         # Use generate_pdf_a4_layout to fit multiple cards on A4 pages
         total_cards_drawn = generate_pdf_a4_layout(
@@ -120,11 +71,11 @@ async def export_flashcards_pdf(
             include_text_back=request.include_text_back,
             include_ipa_back=request.include_ipa_back,
             include_description_back=request.include_description_back,
-            card_format=card_format,
+            card_format=pagesize,  # Card format (A6 or A8)
         )
     else:
         # Use normal generate_pdf with the specified page format
-        c = canvas.Canvas(buffer, pagesize=pagesize)
+        c = canvas.Canvas(buffer, pagesize=pagesize, pageCompression=1)
         
         total_cards_drawn = generate_pdf(
             c=c,
@@ -146,12 +97,103 @@ async def export_flashcards_pdf(
     # Save PDF
     c.save()
     buffer.seek(0)
+    return buffer
+
+
+# A plain def: FastAPI runs it in the threadpool, so the blocking queries and
+# the CPU-bound rendering stay off the event loop
+@router.post("/pdf")
+def export_flashcards_pdf(
+    request: FlashcardExportRequest,
+    session: Session = Depends(get_readonly_session)
+):
+    """
+    Export flashcards as PDF.
+    Each concept gets front and back sides on separate pages.
+    Page format is determined by the 'layout' parameter ('a4', 'a5', or 'a6').
+    """
+    if not request.concept_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="concept_ids cannot be empty"
+        )
+    
+    # Validate languages are provided if any text-related fields are enabled
+    if (request.include_text_front or request.include_ipa_front or request.include_description_front) and not request.languages_front:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="languages_front cannot be empty when text, IPA, or description is enabled on front side"
+        )
+    
+    if (request.include_text_back or request.include_ipa_back or request.include_description_back) and not request.languages_back:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="languages_back cannot be empty when text, IPA, or description is enabled on back side"
+        )
+    
+    
+    # Fetch all concepts with their lemmas and topics in bulk (one query per table, not per concept)
+    concept_ids = list(dict.fromkeys(request.concept_ids))
+    concepts_by_id = {
+        concept.id: concept
+        for concept in session.exec(select(Concept).where(Concept.id.in_(concept_ids))).all()
+    }
+    
+    # Get ALL lemmas for these concepts (no limit, no pagination - we need every single one)
+    lemmas_by_concept = {}
+    lemmas_statement = (
+        select(Lemma)
+        .where(Lemma.concept_id.in_(concept_ids))
+        .options(load_only(*_CARD_LEMMA_COLUMNS))
+        .order_by(Lemma.id)
+    )
+    for lemma in session.exec(lemmas_statement).all():
+        lemmas_by_concept.setdefault(lemma.concept_id, []).append(lemma)
+    
+    # Get topic if available (use first topic from ConceptTopic), joined in one query
+    topics_by_concept = {}
+    topics_statement = (
+        select(ConceptTopic.concept_id, Topic)
+        .join(Topic, Topic.id == ConceptTopic.topic_id)
+        .where(ConceptTopic.concept_id.in_(concept_ids))
+    )
+    for concept_id, topic in session.exec(topics_statement).all():
+        topics_by_concept.setdefault(concept_id, topic)
+    
+    # Assemble in request order
+    concepts = []
+    for concept_id in request.concept_ids:
+        concept = concepts_by_id.get(concept_id)
+        if not concept:
+            logger.warning("Concept %d not found, skipping", concept_id)
+            continue
+        
+        lemmas = lemmas_by_concept.get(concept_id, [])
+        topic = topics_by_concept.get(concept_id)
+        concepts.append((concept, lemmas, topic))
+    
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Loaded %d lemmas for %d concepts",
+                    sum(len(lemmas) for _, lemmas, _ in concepts), len(concepts))
+    
+    if not concepts:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No valid concepts found"
+        )
+    
+    logger.info("Exporting %d concepts to PDF with format: %s (fit_to_a4: %s)", 
+                len(concepts), request.layout, request.fit_to_a4)
+    
+    buffer = _render_pdf(concepts, request)
+    pdf_size = buffer.getbuffer().nbytes
     
-    # Return PDF as response
-    return Response(
-        content=buffer.getvalue(),
+    # Stream PDF as response (in chunks, without copying the whole buffer into one bytes object)
+    return StreamingResponse(
+        _iter_buffer(buffer),
         media_type="application/pdf",
         headers={
-            "Content-Disposition": "attachment; filename=flashcards.pdf"
+            "Content-Disposition": "attachment; filename=flashcards.pdf",
+            "Content-Length": str(pdf_size),
         }
     )
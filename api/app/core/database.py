@@ -22,6 +22,9 @@ engine = create_engine(
     max_overflow=10,
 )
 
+# Same pool, but without a transaction around each statement (for read-only endpoints)
+readonly_engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+
 
 def get_session():
     """Dependency for getting database sessions."""
@@ -29,6 +32,12 @@ def get_session():
         yield session
 
 
+def get_readonly_session():
+    """Dependency for getting autocommit database sessions for read-only endpoints."""
+    with Session(readonly_engine) as session:
+        yield session
+
+
 def init_db():
     """Initialize database tables."""
     SQLModel.metadata.create_all(engine)
@@ -4,6 +4,7 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 from pathlib import Path
+from reportlab import rl_config
 import logging
 import os
 import traceback
@@ -106,8 +107,11 @@ app.add_middleware(
 
 @app.on_event("startup")
 async def startup_event():
-    """Initialize database on startup."""
+    """Initialize database and ReportLab settings on startup."""
     init_db()
+    # Intentionally process-wide, for every PDF the API writes: store compressed
+    # streams as raw binary, since ASCII85 text encoding only makes them ~25% larger
+    rl_config.useA85 = 0
 
 
 @app.get("/")
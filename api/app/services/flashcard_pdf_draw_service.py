@@ -2,23 +2,29 @@
 PDF drawing service for flashcard export.
 Contains functions for drawing individual flashcard sides.
 """
+import hashlib
 import logging
+import threading
+from bisect import bisect_right
+from functools import lru_cache
 from io import BytesIO
-from typing import List, Optional, Tuple
+from itertools import accumulate
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple
 from PIL import Image
 from reportlab.lib.pagesizes import A5, A6, A8
 from reportlab.lib.units import mm
 from reportlab.pdfgen import canvas
 from reportlab.lib.utils import ImageReader
-from reportlab.lib.colors import HexColor
+from reportlab.lib.colors import Color, HexColor
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfgen.textobject import PDFTextObject
 
 from app.models.models import Concept, Lemma, Topic
 from app.services.flashcard_service import (
+    SizedLRUCache,
     register_unicode_fonts,
     register_flashcard_fonts,
-    download_image,
+    download_image_bytes,
     get_language_flag_image_path,
     decode_html_entities,
     apply_rounded_corners,
@@ -29,6 +35,441 @@ from app.services.flashcard_service import (
 
 logger = logging.getLogger(__name__)
 
+_font_registration_lock = threading.Lock()
+# Font names resolved by the first call to _ensure_fonts_registered()
+_registered_font_names: Optional[Tuple[Optional[str], Optional[str], str, str, Optional[str]]] = None
+# Every registered font name, snapshotted once the flashcard fonts are registered
+_registered_font_set: FrozenSet[str] = frozenset()
+
+# Resized, rounded concept images shared by both sides of a card (by count and total size)
+_prepared_image_cache: SizedLRUCache[ImageReader] = SizedLRUCache(max_entries=32, max_bytes=64 * 1024 * 1024)
+
+
+# ============================================================================
+# Layout Constants
+# ============================================================================
+
+# Base values for the A5 reference size (portrait cards)
+# A5 dimensions: 148mm x 210mm = 419.53 x 595.28 points (at 72 DPI)
+_REF_WIDTH = A5[0]
+_BASE_MARGIN = 10 * mm
+_BASE_TITLE_FONT_SIZE = 14
+_BASE_DESC_FONT_SIZE = 8
+_BASE_DESC_FONT_SIZE_A6_TITLED = 9  # For A6 prints with title, make description bigger
+_BASE_ICON_SIZE = 16
+_BASE_IMAGE_MARGIN_TOP = 10 * mm
+_BASE_IMAGE_MARGIN_BOTTOM = 16 * mm
+_BASE_FLAG_SPACING = 8
+_BASE_LINE_SPACING = 2
+_BASE_LANGUAGE_SPACING = 28
+_BASE_CORNER_RADIUS = 6 * mm
+
+# Base values for the A8 landscape reference size
+# A8 landscape: 74mm x 52mm = 209.76 x 147.40 points (height becomes width)
+_A8_REF_WIDTH = A8[1]
+_A8_BASE_MARGIN = 7 * mm  # Smaller margin for A8
+_A8_BASE_TITLE_FONT_SIZE = 12
+_A8_BASE_ICON_SIZE = 12
+_A8_BASE_FLAG_SPACING = 4
+_A8_BASE_LINE_SPACING = 3  # More vertical spacing for title & description
+_A8_BASE_LANGUAGE_SPACING = 32
+_A8_BASE_CORNER_RADIUS = 3 * mm
+_A8_IMAGE_WIDTH_PERCENT = 0.80  # Image width as a share of the page width
+
+# Colors (parsed once)
+_WHITE = HexColor("#FFFFFF")
+_BLACK = HexColor("#000000")
+_ICON_GRAY = HexColor("#CCCCCC")  # Subtle gray for topic icons
+_IPA_GRAY = HexColor("#aaaaaa")
+_DESC_GRAY = HexColor("#999999")
+_A8_DESC_GRAY = HexColor("#666666")  # Darker grey for the smaller A8 description
+
+
+class _CardLayout(NamedTuple):
+    """Scaled dimensions for a portrait (A5/A6) card side."""
+    scale_factor: float
+    language_font_scale: float
+    margin: float
+    title_font_size: float
+    desc_font_size: float
+    icon_size: float
+    image_margin_top: float
+    image_margin_bottom: float
+    flag_spacing: float
+    line_spacing: float
+    language_spacing: float
+    corner_radius: float
+    image_width: float
+
+
+class _A8CardLayout(NamedTuple):
+    """Scaled dimensions for an A8 landscape card side."""
+    scale_factor: float
+    language_font_scale: float
+    margin: float
+    title_font_size: float
+    ipa_font_size: float
+    desc_font_size: float
+    icon_size: float
+    flag_spacing: float
+    line_spacing: float
+    language_spacing: float
+    corner_radius: float
+    image_margin_top: float
+    image_margin_bottom: float
+    content_margin: float
+
+
+def _ensure_fonts_registered() -> Tuple[Optional[str], Optional[str], str, str, Optional[str]]:
+    """Register the flashcard fonts on first use and return their names.
+
+    Font discovery walks the font directories and parses TTF files, so it runs
+    once per process. Returns (unicode, emoji, title, description, IPA) font names.
+    """
+    global _registered_font_names, _registered_font_set
+    if _registered_font_names is not None:
+        return _registered_font_names
+    # Exports render in worker threads; only one of them registers the fonts
+    with _font_registration_lock:
+        if _registered_font_names is not None:
+            return _registered_font_names
+        unicode_font, emoji_font = register_unicode_fonts()
+        title_font, desc_font, ipa_font = register_flashcard_fonts()
+        # Set before the names, which mark registration as done
+        _registered_font_set = frozenset(pdfmetrics.getRegisteredFontNames())
+        names = (unicode_font, emoji_font, title_font, desc_font, ipa_font)
+        _registered_font_names = names
+        # Logged once at registration rather than for every card side
+        logger.debug("All registered fonts: %s", sorted(_registered_font_set))
+        logger.debug(
+            "Using fonts - Title: %s, Description: %s, IPA: %s, Unicode: %s, Emoji: %s",
+            title_font, desc_font, ipa_font, unicode_font, emoji_font
+        )
+    return names
+
+
+def _language_font_scale(num_languages: int, has_image: bool, crowded_scale: float = 1.0) -> float:
+    """Font scale factor based on the number of languages shown on a card.
+
+    If image given: 3 languages = baseline, 2 = bigger, 1 = even bigger.
+    If image not given: 5 languages = 1.0, 4 = bigger, 3 = even bigger, etc.
+    """
+    if has_image:
+        if num_languages >= 3:
+            return crowded_scale
+        if num_languages == 2:
+            return 1.0 + (1.0 / 3.0)  # 1.333...
+        if num_languages == 1:
+            return 1.0 + (2.0 / 3.0)  # 1.667...
+        return 1.0
+    if num_languages >= 5:
+        return 1.0
+    if num_languages >= 1:
+        # 5 -> 4 is 1.2x, 5 -> 3 is 1.4x, 5 -> 2 is 1.6x, 5 -> 1 is 1.8x
+        return 1.0 + ((5 - num_languages) / 5.0)
+    return 1.0
+
+
+@lru_cache(maxsize=64)
+def _compute_layout(
+    page_size: Tuple[float, float],
+    num_languages: int,
+    has_image: bool,
+    include_title: bool,
+) -> _CardLayout:
+    """Scale the A5 reference layout to a portrait card of the given size.
+
+    Only depends on the card shape and a few flags, so every card side of an
+    export shares a handful of cached layouts.
+    """
+    width, height = page_size
+
+    # Check if this is A6 size (with tolerance for floating point comparison)
+    a6_width, a6_height = A6
+    is_a6 = abs(width - a6_width) < 1.0 and abs(height - a6_height) < 1.0
+
+    # Calculate scale factor based on width ratio (width is primary dimension for scaling)
+    scale_factor = width / _REF_WIDTH
+    language_font_scale = _language_font_scale(num_languages, has_image, crowded_scale=0.95)
+    base_desc_font_size = _BASE_DESC_FONT_SIZE_A6_TITLED if (is_a6 and include_title) else _BASE_DESC_FONT_SIZE
+
+    return _CardLayout(
+        scale_factor=scale_factor,
+        language_font_scale=language_font_scale,
+        margin=_BASE_MARGIN * scale_factor,
+        title_font_size=_BASE_TITLE_FONT_SIZE * scale_factor * language_font_scale,
+        desc_font_size=base_desc_font_size * scale_factor * language_font_scale,
+        icon_size=_BASE_ICON_SIZE * scale_factor,
+        image_margin_top=_BASE_IMAGE_MARGIN_TOP * scale_factor,
+        # Spacing between image and content scales with language count
+        image_margin_bottom=_BASE_IMAGE_MARGIN_BOTTOM * scale_factor * language_font_scale,
+        flag_spacing=_BASE_FLAG_SPACING * scale_factor,
+        # Line spacing (between title/description/IPA lines) scales with language count
+        line_spacing=_BASE_LINE_SPACING * scale_factor * language_font_scale,
+        # Language spacing (between languages) scales with language count
+        language_spacing=_BASE_LANGUAGE_SPACING * scale_factor * language_font_scale,
+        corner_radius=_BASE_CORNER_RADIUS * scale_factor,
+        # Image width is 40% of page width
+        image_width=width * 0.4,
+    )
+
+
+@lru_cache(maxsize=64)
+def _compute_layout_a8(
+    page_size: Tuple[float, float],
+    num_languages: int,
+    has_image: bool,
+    include_title: bool,
+) -> _A8CardLayout:
+    """Scale the A8 landscape reference layout to a card of the given size."""
+    width, _ = page_size
+    scale_factor = width / _A8_REF_WIDTH
+    language_font_scale = _language_font_scale(num_languages, has_image)
+
+    margin = _A8_BASE_MARGIN * scale_factor
+    title_font_size = _A8_BASE_TITLE_FONT_SIZE * scale_factor * language_font_scale
+
+    return _A8CardLayout(
+        scale_factor=scale_factor,
+        language_font_scale=language_font_scale,
+        margin=margin,
+        title_font_size=title_font_size,
+        # IPA font size is 70% of title font size
+        ipa_font_size=title_font_size * 0.7,
+        # Description font size: 70% of title if title is present, 90% if not
+        desc_font_size=title_font_size * (0.7 if include_title else 0.9),
+        icon_size=_A8_BASE_ICON_SIZE * scale_factor,
+        flag_spacing=_A8_BASE_FLAG_SPACING * scale_factor,
+        line_spacing=_A8_BASE_LINE_SPACING * scale_factor * language_font_scale,
+        language_spacing=_A8_BASE_LANGUAGE_SPACING * scale_factor * language_font_scale,
+        corner_radius=_A8_BASE_CORNER_RADIUS * scale_factor,
+        image_margin_top=margin * 2,
+        # Spacing between image and content scales with language count
+        image_margin_bottom=margin * 2 * language_font_scale,
+        content_margin=margin * 0.95,
+    )
+
+
+def _resample_filter(source_width: int, target_width: int) -> Image.Resampling:
+    """LANCZOS for strong reductions; BICUBIC is as sharp and cheaper for mild ones."""
+    if source_width > target_width * 1.5:
+        return Image.Resampling.LANCZOS
+    return Image.Resampling.BICUBIC
+
+
+@lru_cache(maxsize=8)
+def _arabic_font(unicode_font: Optional[str], fallback_font: str) -> str:
+    """Pick the font for Arabic text: ArabicFont, then the Unicode font, then fallback.
+
+    Fonts are registered once per process, so the choice is cached instead of
+    walking the font registry for every lemma.
+    """
+    registered_fonts = pdfmetrics.getRegisteredFontNames()
+    if "ArabicFont" in registered_fonts:
+        return "ArabicFont"
+    if unicode_font and unicode_font in registered_fonts:
+        logger.warning("ArabicFont not found, using Unicode font '%s' for Arabic text", unicode_font)
+        return unicode_font
+    # Fallback: try to use any registered Unicode-supporting font
+    unicode_candidates = [f for f in registered_fonts if 'Unicode' in f or 'Noto' in f or 'Arial' in f or 'Arabic' in f]
+    if unicode_candidates:
+        logger.warning("Arabic font not found, using fallback: %s for Arabic text", unicode_candidates[0])
+        return unicode_candidates[0]
+    logger.error("No Unicode font available for Arabic text, using default font (may not render correctly): %s", fallback_font)
+    return fallback_font
+
+
+@lru_cache(maxsize=8192)
+def _text_width(text: str, font_name: str, font_size: float) -> float:
+    """Width of a word or wrapped line in points.
+
+    Cached: the same words and lines are measured while wrapping and again
+    while centering, and once more on the other side of the card.
+    """
+    return pdfmetrics.stringWidth(text, font_name, font_size)
+
+
+@lru_cache(maxsize=2048)
+def _wrap_words(
+    text: str,
+    font_name: str,
+    font_size: float,
+    max_width: float,
+) -> Tuple[str, ...]:
+    """Greedily wrap text into lines no wider than max_width.
+
+    Word widths are cached and summed once; each line break is then found by
+    bisecting the running totals instead of measuring the growing line for
+    every word. A word wider than max_width gets a line of its own.
+
+    Cached (as a tuple), so a lemma shown on both sides of a card, or exported
+    again, is wrapped once.
+    """
+    words = text.split()
+    if len(words) <= 1:
+        return tuple(words)
+    
+    # Most titles and short descriptions fit on one line: measure once and skip the loop
+    single_line = " ".join(words)
+    if _text_width(single_line, font_name, font_size) <= max_width:
+        return (single_line,)
+    
+    space_width = _text_width(" ", font_name, font_size)
+    # offsets[k] is the width of words[:k], each word counted with one leading space,
+    # so words[i:j] spans offsets[j] - offsets[i] - space_width
+    offsets = list(accumulate(
+        (space_width + _text_width(word, font_name, font_size) for word in words),
+        initial=0.0,
+    ))
+    
+    lines: List[str] = []
+    start = 0
+    while start < len(words):
+        # Furthest line end that still fits; the first word always goes on the line
+        end = bisect_right(offsets, offsets[start] + space_width + max_width, start + 1) - 1
+        end = max(end, start + 1)
+        lines.append(" ".join(words[start:end]))
+        start = end
+    return tuple(lines)
+
+
+def _lines_above(y: float, bottom: float, line_height: float) -> int:
+    """Number of lines that fit with baselines from y down to bottom."""
+    if y < bottom:
+        return 0
+    return int((y - bottom) / line_height) + 1
+
+
+def _set_text_style(
+    textobj: PDFTextObject,
+    current: Optional[Tuple[str, float, Color]],
+    font_name: str,
+    font_size: float,
+    color: Color,
+) -> Tuple[str, float, Color]:
+    """Switch a text object to the given font and fill color, emitting only what changed."""
+    if current is None or current[:2] != (font_name, font_size):
+        textobj.setFont(font_name, font_size)
+    if current is None or current[2] != color:
+        textobj.setFillColor(color)
+    return font_name, font_size, color
+
+
+@lru_cache(maxsize=128)
+def _ascent(font_name: str, font_size: float) -> float:
+    """Ascent of a font at the given size, in points."""
+    return pdfmetrics.getAscent(font_name) * font_size / 1000.0
+
+
+def _decoded_image_reader(pil_image: Image.Image) -> Tuple[ImageReader, int]:
+    """Wrap a PIL image in an ImageReader with its pixel data decoded up front.
+
+    ImageReader decodes lazily and clears its soft mask while doing so, so a
+    cached reader that concurrent exports draw from must be fully decoded
+    before it is shared; afterwards drawing only reads it.
+    Returns the reader and the bytes it holds: the source image plus the
+    decoded color and alpha data.
+    """
+    reader = ImageReader(pil_image)
+    size = pil_image.width * pil_image.height * len(pil_image.getbands())
+    size += len(reader.getRGBData())
+    if reader._dataA:
+        size += len(reader._dataA.getRGBData())
+    return reader, size
+
+
+@lru_cache(maxsize=128)
+def _load_flag_image(lang_code: str, flag_height: float) -> Tuple[ImageReader, float]:
+    """Load the language flag scaled to flag_height, with rounded corners.
+
+    Returns (image reader, flag width). Cached per language and size, so each
+    flag is resized and encoded once and the same image object is reused for
+    every card that shows it. Raises on failure, so failed loads are not cached.
+    """
+    flag_image_path = get_language_flag_image_path(lang_code)
+    if not (flag_image_path and flag_image_path.exists()):
+        raise FileNotFoundError(f"Language flag image not found for {lang_code} (checked path: {flag_image_path})")
+
+    pil_flag = Image.open(flag_image_path)
+    # Maintain aspect ratio, scale to match desired height
+    flag_aspect = pil_flag.width / pil_flag.height
+    flag_width = flag_height * flag_aspect
+    # Supersample for sharper output: render at 3x target and let PDF scale down
+    supersample_factor = 3
+    target_width_px = max(int(flag_width * supersample_factor), 1)
+    target_height_px = max(int(flag_height * supersample_factor), 1)
+    if pil_flag.size != (target_width_px, target_height_px):
+        pil_flag = pil_flag.resize((target_width_px, target_height_px), _resample_filter(pil_flag.width, target_width_px))
+
+    # Use a smaller corner radius for flags (scaled by supersample factor)
+    flag_corner_radius_px = max(2 * supersample_factor, min(int(flag_height * 0.15 * supersample_factor), 4 * supersample_factor))  # 15% of height, 2-4pt
+    pil_flag = apply_rounded_corners(pil_flag, flag_corner_radius_px)
+
+    # Hand the RGBA image straight to ReportLab (alpha becomes the soft mask)
+    return _decoded_image_reader(pil_flag)[0], flag_width
+
+
+def _get_flag_image(lang_code: str, flag_height: float) -> Tuple[Optional[ImageReader], float]:
+    """Language flag scaled to flag_height, or (None, 0) when no flag is available."""
+    if flag_height <= 0:
+        # Degenerate size: nothing would be visible, so don't decode or embed the flag
+        return None, 0
+
+    try:
+        return _load_flag_image(lang_code, flag_height)
+    except FileNotFoundError as e:
+        logger.warning("%s", str(e))
+        return None, 0
+    except Exception as e:
+        logger.warning("Failed to load language flag image for %s: %s", lang_code, str(e))
+        logger.debug("Traceback:", exc_info=True)
+        return None, 0
+
+
+def _lemmas_by_language(lemmas: List[Lemma]) -> Dict[str, Lemma]:
+    """Map lowercased language code to lemma, keeping the first lemma per language."""
+    lemmas_by_lang: Dict[str, Lemma] = {}
+    for lemma in lemmas:
+        lemmas_by_lang.setdefault(lemma.language_code.lower(), lemma)
+    return lemmas_by_lang
+
+
+def _prepare_concept_image(
+    image_bytes: bytes,
+    render_width_px: int,
+    render_height_px: int,
+    corner_radius_px: float,
+) -> ImageReader:
+    """Resize a concept image to its supersampled size and round its corners.
+
+    Cached on a digest of the image bytes and the target size, so the front
+    and back of a card only resize and encode their shared image once.
+    """
+    cache_key = (
+        hashlib.blake2b(image_bytes, digest_size=16).digest(),
+        render_width_px,
+        render_height_px,
+        corner_radius_px,
+    )
+    image_reader = _prepared_image_cache.get(cache_key)
+    if image_reader is not None:
+        return image_reader
+    
+    pil_image = Image.open(BytesIO(image_bytes))
+    # Resize with high-quality resampling to supersampled size
+    if pil_image.size != (render_width_px, render_height_px):
+        # Large JPEGs decode directly at a reduced scale (down to 1/8) that still
+        # covers the target size, instead of decoding every pixel first (no-op for other formats)
+        pil_image.draft(pil_image.mode, (render_width_px, render_height_px))
+        pil_image = pil_image.resize((render_width_px, render_height_px), _resample_filter(pil_image.width, render_width_px))
+    
+    pil_image = apply_rounded_corners(pil_image, corner_radius_px)
+    
+    # Hand the RGBA image straight to ReportLab (alpha becomes the soft mask)
+    image_reader, size = _decoded_image_reader(pil_image)
+    _prepared_image_cache.put(cache_key, image_reader, size)
+    return image_reader
+
 
 # ============================================================================
 # PDF Drawing Utilities
@@ -47,6 +488,7 @@ def draw_card_side(
     include_ipa: bool = True,
     include_description: bool = True,
     page_size: Optional[Tuple[float, float]] = None,
+    clear_background: bool = True,
 ):
     """Draw one side of a flashcard (supports A5 or A6 size).
     
@@ -64,6 +506,8 @@ def draw_card_side(
         include_description: Whether to include description for each lemma
         page_size: Optional page size tuple (width, height) in points. If not provided, 
                    will be determined from canvas pagesize.
+        clear_background: Whether to paint the card area white first. Needed when cards
+                          share a page (it hides neighbouring overflow); a fresh page is white.
     """
     # Get canvas pagesize to determine card dimensions
     # Use provided page_size or try to get from canvas, fallback to A5
@@ -78,117 +522,47 @@ def draw_card_side(
             # Fallback to A5 if pagesize cannot be determined
             width, height = A5
     
-    # Use A5 as reference size for scaling calculations
-    # A5 dimensions: 148mm x 210mm = 419.53 x 595.28 points (at 72 DPI)
-    ref_width, _ = A5
-    
-    # Check if this is A6 size (with tolerance for floating point comparison)
-    a6_width, a6_height = A6
-    is_a6 = abs(width - a6_width) < 1.0 and abs(height - a6_height) < 1.0
-    
-    # Calculate scale factor based on width ratio (width is primary dimension for scaling)
-    scale_factor = width / ref_width
-    
-    # Scale all dimensions proportionally
-    # Base values (for A5 reference size)
-    base_margin = 10 * mm
-    base_title_font_size = 14
-    # For A6 prints with title, make description bigger
-    base_desc_font_size = 9 if (is_a6 and include_title) else 8
-    base_icon_size = 16
-    base_image_margin_top = 10 * mm
-    base_image_margin_bottom = 16 * mm
-    base_flag_spacing = 8
-    base_line_spacing = 2
-    base_language_spacing = 28
-    base_corner_radius = 6 * mm
+    # Index lemmas by language once instead of scanning the list per language
+    lemmas_by_lang = _lemmas_by_language(lemmas)
     
-    # Calculate font scaling based on number of languages and image presence
     # Count languages that will actually be displayed (have lemmas)
-    num_languages = sum(1 for lang_code in languages 
-                       if next((l for l in lemmas if l.language_code.lower() == lang_code.lower()), None) is not None)
+    num_languages = sum(1 for lang_code in languages if lang_code.lower() in lemmas_by_lang)
     
     # Check if image will be displayed
     has_image = include_image and concept.image_url is not None
     
-    # Calculate language-based font scale factor
-    # If image given: 3 languages = 1.0, 2 = bigger, 1 = even bigger
-    # If image not given: 5 languages = 1.0, 4 = bigger, 3 = even bigger, etc.
-    if has_image:
-        # With image: 3 languages is baseline (1.0), scale up for fewer languages
-        if num_languages >= 3:
-            language_font_scale = 0.95
-        elif num_languages == 2:
-            # Scale linearly bigger: 3 -> 2 is 1.5x the difference
-            language_font_scale = 1.0 + (1.0 / 3.0)  # 1.333...
-        elif num_languages == 1:
-            # Even bigger: 3 -> 1 is 2x the difference
-            language_font_scale = 1.0 + (2.0 / 3.0)  # 1.667...
-        else:
-            language_font_scale = 1.0
-    else:
-        # Without image: 5 languages is baseline (1.0), scale up for fewer languages
-        if num_languages >= 5:
-            language_font_scale = 1.0
-        elif num_languages == 4:
-            # Scale linearly bigger: 5 -> 4 is 1.25x
-            language_font_scale = 1.0 + (1.0 / 5.0)  # 1.2
-        elif num_languages == 3:
-            # 5 -> 3 is 1.4x
-            language_font_scale = 1.0 + (2.0 / 5.0)  # 1.4
-        elif num_languages == 2:
-            # 5 -> 2 is 1.6x
-            language_font_scale = 1.0 + (3.0 / 5.0)  # 1.6
-        elif num_languages == 1:
-            # 5 -> 1 is 1.8x
-            language_font_scale = 1.0 + (4.0 / 5.0)  # 1.8
-        else:
-            language_font_scale = 1.0
-    
-    # Scaled values
-    margin = base_margin * scale_factor
-    title_font_size = base_title_font_size * scale_factor * language_font_scale
-    desc_font_size = base_desc_font_size * scale_factor * language_font_scale
-    icon_size = base_icon_size * scale_factor
-    image_margin_top = base_image_margin_top * scale_factor
-    # Scale image margin bottom (spacing between image and content) with language count
-    image_margin_bottom = base_image_margin_bottom * scale_factor * language_font_scale
-    flag_spacing = base_flag_spacing * scale_factor
-    # Scale line spacing (between title/description/IPA lines) with language count
-    line_spacing = base_line_spacing * scale_factor * language_font_scale
-    # Scale language spacing (between languages) with language count
-    language_spacing = base_language_spacing * scale_factor * language_font_scale
-    
-    # Image width is 40% of page width
-    image_width = width * 0.4
-    
-    # Register Unicode fonts for IPA symbols and emojis
-    unicode_font, emoji_font = register_unicode_fonts()
-    title_font, desc_font, ipa_font = register_flashcard_fonts()
+    # Scaled dimensions (cached per card shape)
+    layout = _compute_layout((width, height), num_languages, has_image, include_title)
+    scale_factor = layout.scale_factor
+    language_font_scale = layout.language_font_scale
+    margin = layout.margin
+    title_font_size = layout.title_font_size
+    desc_font_size = layout.desc_font_size
+    icon_size = layout.icon_size
+    image_margin_top = layout.image_margin_top
+    image_margin_bottom = layout.image_margin_bottom
+    flag_spacing = layout.flag_spacing
+    line_spacing = layout.line_spacing
+    language_spacing = layout.language_spacing
+    image_width = layout.image_width
     
-    # Log registered fonts for debugging
-    registered_fonts = pdfmetrics.getRegisteredFontNames()
-    logger.info("All registered fonts: %s", registered_fonts)
-    logger.info(
-        "Using fonts - Title: %s, Description: %s, IPA: %s, Unicode: %s, Emoji: %s",
-        title_font, desc_font, ipa_font, unicode_font, emoji_font
-    )
-    if "ArabicFont" in registered_fonts:
-        logger.info("ArabicFont is available for Arabic text rendering")
-    else:
-        logger.warning("ArabicFont is NOT registered - Arabic text may not render correctly!")
+    # Unicode fonts for IPA symbols and emojis, display fonts for title/description
+    unicode_font, emoji_font, title_font, desc_font, ipa_font = _ensure_fonts_registered()
+    # Set lookups for the font checks below, instead of listing the registry each time
+    registered_fonts = _registered_font_set
     
     # Clear background (at offset position)
-    c.setFillColor(HexColor("#FFFFFF"))
-    c.rect(offset_x, offset_y, width, height, fill=1, stroke=0)
+    if clear_background:
+        c.setFillColor(_WHITE)
+        c.rect(offset_x, offset_y, width, height, fill=1, stroke=0)
     
     # Topic icon at top right (subtle) - use emoji font if available
     if topic and topic.icon:
         icon_drawn = False
-        if emoji_font and emoji_font in pdfmetrics.getRegisteredFontNames():
+        if emoji_font and emoji_font in registered_fonts:
             try:
                 c.setFont(emoji_font, icon_size)
-                c.setFillColor(HexColor("#CCCCCC"))  # Subtle gray
+                c.setFillColor(_ICON_GRAY)  # Subtle gray
                 icon_width = c.stringWidth(topic.icon, emoji_font, icon_size)
                 icon_x = offset_x + width - margin - icon_width
                 icon_y = offset_y + height - margin - icon_size
@@ -197,10 +571,10 @@ def draw_card_side(
             except Exception as e:
                 logger.debug("Failed to draw topic icon with emoji font: %s", str(e))
         
-        if not icon_drawn and unicode_font and unicode_font in pdfmetrics.getRegisteredFontNames():
+        if not icon_drawn and unicode_font and unicode_font in registered_fonts:
             try:
                 c.setFont(unicode_font, icon_size)
-                c.setFillColor(HexColor("#CCCCCC"))  # Subtle gray
+                c.setFillColor(_ICON_GRAY)  # Subtle gray
                 icon_width = c.stringWidth(topic.icon, unicode_font, icon_size)
                 icon_x = offset_x + width - margin - icon_width
                 icon_y = offset_y + height - margin - icon_size
@@ -219,11 +593,11 @@ def draw_card_side(
         y -= image_margin_top
     
     if include_image and concept.image_url:
-        image_data = download_image(concept.image_url)
-        if image_data:
+        image_bytes = download_image_bytes(concept.image_url)
+        if image_bytes:
             try:
-                # Open with PIL to resize
-                pil_image = Image.open(image_data)
+                # Open lazily to read the size; pixels are only decoded on a cache miss
+                pil_image = Image.open(BytesIO(image_bytes))
                 # Image width is 50% of page width (as requested)
                 max_width = image_width
                 
@@ -250,13 +624,9 @@ def draw_card_side(
                 render_width_px = max(int(target_width_px * supersample_factor), 1)
                 render_height_px = max(int(target_height_px * supersample_factor), 1)
                 
-                # Resize with high-quality resampling to supersampled size
-                if pil_image.size != (render_width_px, render_height_px):
-                    pil_image = pil_image.resize((render_width_px, render_height_px), Image.Resampling.LANCZOS)
-                
                 # Add rounded corners using a mask
                 # Scale corner radius proportionally with page size
-                corner_radius_scaled = base_corner_radius * scale_factor
+                corner_radius_scaled = layout.corner_radius
                 # Convert to pixels for the supersampled image
                 corner_radius_px = int((corner_radius_scaled / width) * new_width * supersample_factor)
                 # Ensure reasonable radius (scaled appropriately for supersampled image)
@@ -264,20 +634,14 @@ def draw_card_side(
                 max_radius = 30 * supersample_factor * scale_factor
                 corner_radius_px = max(min_radius, min(corner_radius_px, max_radius))
                 
-                # Apply rounded corners using the helper function
-                pil_image = apply_rounded_corners(pil_image, corner_radius_px)
-                
-                # Save to BytesIO with full quality (PNG for transparency support)
-                img_buffer = BytesIO()
-                # Save with no compression for maximum quality
-                pil_image.save(img_buffer, format="PNG", compress_level=0, optimize=False)
-                img_buffer.seek(0)
+                # Resize and round the corners (cached, shared by front and back)
+                image_reader = _prepare_concept_image(image_bytes, render_width_px, render_height_px, corner_radius_px)
                 
                 # Draw image centered (rounded corners are already applied via mask)
                 img_x = offset_x + (width - new_width) / 2
                 img_y = y - new_height
-                # mask='auto' ensures the PNG alpha (rounded corners) is respected by reportlab
-                c.drawImage(ImageReader(img_buffer), img_x, img_y, width=new_width, height=new_height, mask='auto')
+                # mask='auto' ensures the alpha (rounded corners) is respected by reportlab
+                c.drawImage(image_reader, img_x, img_y, width=new_width, height=new_height, mask='auto')
                 y = img_y - image_margin_bottom  # More spacing below image
             except Exception as e:
                 logger.warning("Failed to draw image for concept %d: %s", concept.id, str(e))
@@ -285,10 +649,26 @@ def draw_card_side(
                 estimated_image_height = image_width / 1.5  # Assume 1.5:1 aspect ratio
                 y -= estimated_image_height + image_margin_bottom
     
+    # Horizontal center of the card; every centered line is placed relative to it
+    center_x = offset_x + width * 0.5
+    
+    # Title and description lines of every language go into one text object, drawn after the loop
+    side_textobj = c.beginText()
+    side_text_style: Optional[Tuple[str, float, Color]] = None
+    use_text_object = True
+    
+    # A side without title, IPA or description (e.g. image only) has no per-language work
+    text_languages = languages if (include_title or include_ipa or include_description) else []
+    
+    # Per-side sizes shared by every language
+    content_width = width - 2 * margin
+    title_flag_height = title_font_size * 0.85
+    desc_flag_height = desc_font_size * 1.5
+    
     # Draw lemmas for each language
-    for lang_code in languages:
+    for lang_code in text_languages:
         # Find lemma for this language
-        lemma = next((l for l in lemmas if l.language_code.lower() == lang_code.lower()), None)
+        lemma = lemmas_by_lang.get(lang_code.lower())
         if not lemma:
             continue
         
@@ -300,161 +680,108 @@ def draw_card_side(
             # Load language flag image and draw it before title text
             translation_text = decode_html_entities(lemma.term)
             
-            # Process Arabic text for proper rendering
-            if should_use_unicode_font(lang_code, translation_text):
+            # Process Arabic text for proper rendering (decided once per lemma)
+            use_unicode_for_title = should_use_unicode_font(lang_code, translation_text)
+            if use_unicode_for_title:
                 translation_text = process_arabic_text(translation_text)
             
             # Get language flag image
-            flag_image_path = get_language_flag_image_path(lang_code)
-            flag_image_data = None
-            flag_width = 0
             # Keep flag height proportional to title font size
-            flag_height = title_font_size * 0.85
-            
-            if flag_image_path and flag_image_path.exists():
-                try:
-                    logger.debug("Loading flag image for %s from %s", lang_code, flag_image_path)
-                    # Open image directly from path with PIL
-                    pil_flag = Image.open(flag_image_path)
-                    logger.debug("Flag image loaded: %dx%d pixels", pil_flag.width, pil_flag.height)
-                    # Maintain aspect ratio, scale to match desired height
-                    flag_aspect = pil_flag.width / pil_flag.height
-                    flag_width = flag_height * flag_aspect
-                    logger.debug("Flag image will be rendered at %fx%f points", flag_width, flag_height)
-                    # Supersample for sharper output: render at 3x target and let PDF scale down
-                    target_width_px = max(int(flag_width * 3), 1)
-                    target_height_px = max(int(flag_height * 3), 1)
-                    if pil_flag.size != (target_width_px, target_height_px):
-                        pil_flag = pil_flag.resize((target_width_px, target_height_px), Image.Resampling.LANCZOS)
-                    
-                    # Apply rounded corners to flag image
-                    # Use a smaller corner radius for flags (scaled by supersample factor)
-                    flag_corner_radius_px = max(2 * 3, min(int(flag_height * 0.15 * 3), 4 * 3))  # 15% of height, max 8px, scaled by 3x
-                    logger.info(flag_corner_radius_px)
-                    pil_flag = apply_rounded_corners(pil_flag, flag_corner_radius_px)
-                    
-                    # Save to buffer with high quality (no compression)
-                    flag_buffer = BytesIO()
-                    pil_flag.save(flag_buffer, format="PNG", compress_level=0, optimize=False)
-                    flag_buffer.seek(0)
-                    flag_image_data = flag_buffer
-                    logger.debug("Flag image processed and ready for rendering")
-                except Exception as e:
-                    logger.warning("Failed to load language flag image for %s from %s: %s", lang_code, flag_image_path, str(e))
-                    import traceback
-                    logger.debug("Traceback: %s", traceback.format_exc())
-                    flag_image_data = None
-            else:
-                logger.warning("Language flag image not found for %s (checked path: %s)", lang_code, flag_image_path)
+            flag_height = title_flag_height
+            flag_reader, flag_width = _get_flag_image(lang_code, flag_height)
             
             # Determine which font to use for this text (use Arabic font for Arabic, Unicode for others)
-            use_unicode_for_title = should_use_unicode_font(lang_code, translation_text)
-            if use_unicode_for_title:
-                # For Arabic, prefer Arabic font, then Unicode font, then fallback
-                registered_fonts = pdfmetrics.getRegisteredFontNames()
-                logger.debug("Registered fonts for Arabic text: %s", registered_fonts)
-                if "ArabicFont" in registered_fonts:
-                    title_font_to_use = "ArabicFont"
-                    logger.info("Using ArabicFont for Arabic text (lang: %s): %s", lang_code, translation_text[:50])
-                elif unicode_font and unicode_font in registered_fonts:
-                    title_font_to_use = unicode_font
-                    logger.warning("ArabicFont not found, using Unicode font '%s' for Arabic text (lang: %s): %s", 
-                                 unicode_font, lang_code, translation_text[:50])
-                else:
-                    # Fallback: try to use any registered Unicode-supporting font
-                    unicode_candidates = [f for f in registered_fonts if 'Unicode' in f or 'Noto' in f or 'Arial' in f or 'Arabic' in f]
-                    if unicode_candidates:
-                        title_font_to_use = unicode_candidates[0]
-                        logger.warning("Arabic font not found, using fallback: %s for Arabic text (lang: %s)", title_font_to_use, lang_code)
-                    else:
-                        title_font_to_use = title_font
-                        logger.error("No Unicode font available for Arabic text (lang: %s), using default font (may not render correctly): %s", 
-                                   lang_code, title_font_to_use)
-            else:
-                title_font_to_use = title_font
+            title_font_to_use = _arabic_font(unicode_font, title_font) if use_unicode_for_title else title_font
+            
+            # RTL rendering is a property of the whole title, not of each wrapped line
+            title_is_arabic = use_unicode_for_title and contains_arabic_characters(translation_text)
             
             # Word wrap for translation text (accounting for flag image)
-            c.setFont(title_font_to_use, title_font_size)
-            words = translation_text.split()
-            lines = []
-            current_line = ""
-            current_flag_spacing = flag_spacing if flag_image_data else 0
-            max_width_text = width - 2 * margin - flag_width - current_flag_spacing
+            current_flag_spacing = flag_spacing if flag_reader else 0
+            max_width_text = content_width - flag_width - current_flag_spacing
+            lines = _wrap_words(translation_text, title_font_to_use, title_font_size, max_width_text)
             
-            for word in words:
-                test_line = f"{current_line} {word}".strip()
-                if c.stringWidth(test_line, title_font_to_use, title_font_size) <= max_width_text:
-                    current_line = test_line
-                else:
-                    if current_line:
-                        lines.append(current_line)
-                    current_line = word
+            # For Arabic/RTL text, make sure the chosen font is actually available
+            if title_is_arabic:
+                if title_font_to_use not in registered_fonts and title_font_to_use not in ["Helvetica", "Helvetica-Bold", "Times-Roman", "Courier"]:
+                    logger.error("Font '%s' not available for Arabic text! Available: %s", 
+                               title_font_to_use, sorted(registered_fonts))
+                    # Fallback to Unicode font if available
+                    if unicode_font and unicode_font in registered_fonts:
+                        title_font_to_use = unicode_font
+                        logger.warning("Falling back to Unicode font: %s", unicode_font)
+                    else:
+                        logger.error("No suitable font found for Arabic text!")
+            
+            # Non-Arabic lines go into the side's shared text object; Arabic lines, and every
+            # line once the text object has failed, are drawn on the page with its font and color
+            if title_is_arabic or not use_text_object:
+                c.setFont(title_font_to_use, title_font_size)
+                c.setFillColor(_BLACK)
+            else:
+                side_text_style = _set_text_style(side_textobj, side_text_style, title_font_to_use, title_font_size, _BLACK)
+            # Arabic lines use drawString until the title font fails once, then Helvetica
+            arabic_font_ok = True
             
-            if current_line:
-                lines.append(current_line)
+            # Every line is centered as if prefixed by the flag (0 when there is no flag)
+            flag_prefix_width = flag_width + current_flag_spacing
             
             # Draw translation lines with flag image prefix
             for line_idx, line in enumerate(lines):
                 
                 # Calculate total width (flag + space + text)
-                text_width = c.stringWidth(line, title_font_to_use, title_font_size)
-                total_width = flag_width + current_flag_spacing + text_width if flag_image_data else text_width
+                text_width = _text_width(line, title_font_to_use, title_font_size)
+                total_width = flag_prefix_width + text_width
                 
                 # Center the entire line (flag + text)
-                line_x = offset_x + (width - total_width) / 2
+                line_x = center_x - total_width * 0.5
                 
                 # Draw flag image (only on first line)
-                if line_idx == 0 and flag_image_data:
+                if line_idx == 0 and flag_reader:
                     try:
                         # Align flag slightly below the top of the text (cap height) for better visual alignment
-                        ascent = pdfmetrics.getAscent(title_font_to_use) * title_font_size / 1000.0
+                        ascent = _ascent(title_font_to_use, title_font_size)
                         # Position flag slightly lower - offset by a small amount (scaled with font size)
                         offset = title_font_size * 0.22
                         flag_y = y + ascent - flag_height - offset
-                        c.drawImage(ImageReader(flag_image_data), line_x, flag_y, width=flag_width, height=flag_height, mask='auto')
-                        logger.debug(
-                            "Drew flag image for %s at (%.2f, %.2f) with size (%.2f, %.2f) | ascent=%.2f",
-                            lang_code, line_x, flag_y, flag_width, flag_height, ascent
-                        )
+                        c.drawImage(flag_reader, line_x, flag_y, width=flag_width, height=flag_height, mask='auto')
                     except Exception as e:
                         logger.warning("Failed to draw language flag image: %s", str(e))
                 
                 # Draw text
-                c.setFont(title_font_to_use, title_font_size)
-                c.setFillColor(HexColor("#000000"))
-                text_x = line_x + flag_width + current_flag_spacing if (line_idx == 0 and flag_image_data) else line_x
+                text_x = line_x + flag_width + current_flag_spacing if (line_idx == 0 and flag_reader) else line_x
                 
-                # For Arabic/RTL text, ensure font is set and use appropriate rendering method
-                if use_unicode_for_title and contains_arabic_characters(line):
-                    # Verify font is available
-                    if title_font_to_use not in pdfmetrics.getRegisteredFontNames() and title_font_to_use not in ["Helvetica", "Helvetica-Bold", "Times-Roman", "Courier"]:
-                        logger.error("Font '%s' not available for Arabic text! Available: %s", 
-                                   title_font_to_use, pdfmetrics.getRegisteredFontNames())
-                        # Fallback to Unicode font if available
-                        if unicode_font and unicode_font in pdfmetrics.getRegisteredFontNames():
-                            title_font_to_use = unicode_font
-                            logger.warning("Falling back to Unicode font: %s", unicode_font)
-                        else:
-                            logger.error("No suitable font found for Arabic text!")
-                    
-                    try:
-                        # Use drawString for Arabic - ReportLab handles it correctly with proper font
-                        c.setFont(title_font_to_use, title_font_size)
-                        c.setFillColor(HexColor("#000000"))
-                        c.drawString(text_x, y, line)
-                        logger.debug("Drew Arabic text with font '%s': %s", title_font_to_use, line[:30])
-                    except Exception as e:
-                        logger.error("Failed to draw Arabic text: %s", str(e))
-                        import traceback
-                        logger.debug("Traceback: %s", traceback.format_exc())
-                        # Last resort fallback
+                # For Arabic/RTL text, use appropriate rendering method
+                if title_is_arabic:
+                    if arabic_font_ok:
                         try:
+                            # Use drawString for Arabic - ReportLab handles it correctly with proper font
+                            c.drawString(text_x, y, line)
+                        except Exception as e:
+                            logger.error("Failed to draw Arabic text: %s", str(e))
+                            logger.debug("Traceback:", exc_info=True)
+                            # Every line shares the font: send this and the remaining lines to the fallback
+                            arabic_font_ok = False
                             c.setFont("Helvetica", title_font_size)
+                    if not arabic_font_ok:
+                        # Last resort fallback
+                        try:
                             c.drawString(text_x, y, line)
-                        except:
+                        except Exception:
                             pass
                 else:
-                    c.drawString(text_x, y, line)
+                    if use_text_object:
+                        try:
+                            side_textobj.setTextOrigin(text_x, y)
+                            side_textobj.textLine(line)
+                        except Exception as e:
+                            # Don't retry the text object after a failure; later lines use drawString
+                            logger.warning("Failed to draw title with text object, falling back: %s", str(e))
+                            use_text_object = False
+                            c.setFont(title_font_to_use, title_font_size)
+                            c.setFillColor(_BLACK)
+                    if not use_text_object:
+                        c.drawString(text_x, y, line)
                 y -= title_font_size + line_spacing  # Scaled spacing under each line
 
             y -= line_spacing  # Scaled spacing before IPA
@@ -477,18 +804,17 @@ def draw_card_side(
             # Try to use the selected font (either registered TTF or built-in)
             if ipa_font_to_use:
                 # Check if it's a registered font or a built-in font
-                is_registered = ipa_font_to_use in pdfmetrics.getRegisteredFontNames()
+                is_registered = ipa_font_to_use in registered_fonts
                 is_builtin = ipa_font_to_use in builtin_fonts
                 
                 if is_registered or is_builtin:
                     try:
                         c.setFont(ipa_font_to_use, desc_font_size)
-                        c.setFillColor(HexColor("#aaaaaa"))
-                        ipa_width = c.stringWidth(ipa_text, ipa_font_to_use, desc_font_size)
-                        ipa_x = offset_x + (width - ipa_width) / 2
+                        c.setFillColor(_IPA_GRAY)
+                        ipa_width = _text_width(ipa_text, ipa_font_to_use, desc_font_size)
+                        ipa_x = center_x - ipa_width * 0.5
                         c.drawString(ipa_x, y, ipa_text)
                         ipa_drawn = True
-                        logger.debug("Drew IPA with font: %s", ipa_font_to_use)
                     except Exception as e:
                         logger.debug("Failed to draw IPA with font %s: %s", ipa_font_to_use, str(e))
             
@@ -496,12 +822,11 @@ def draw_card_side(
             if not ipa_drawn:
                 try:
                     c.setFont("Helvetica", desc_font_size)
-                    c.setFillColor(HexColor("#aaaaaa"))
-                    ipa_width = c.stringWidth(ipa_text, "Helvetica", desc_font_size)
-                    ipa_x = offset_x + (width - ipa_width) / 2
+                    c.setFillColor(_IPA_GRAY)
+                    ipa_width = _text_width(ipa_text, "Helvetica", desc_font_size)
+                    ipa_x = center_x - ipa_width * 0.5
                     c.drawString(ipa_x, y, ipa_text)
                     ipa_drawn = True
-                    logger.debug("Drew IPA with Helvetica fallback")
                 except Exception as e:
                     logger.warning("Failed to draw IPA with Helvetica: %s", str(e))
             
@@ -512,193 +837,131 @@ def draw_card_side(
         if include_description and lemma.description:
             desc = decode_html_entities(lemma.description)
             
-            # Process Arabic text for proper rendering
-            if should_use_unicode_font(lang_code, desc):
+            # Process Arabic text for proper rendering (decided once per lemma)
+            use_unicode_for_desc = should_use_unicode_font(lang_code, desc)
+            if use_unicode_for_desc:
                 desc = process_arabic_text(desc)
             
             # Determine which font to use for description (use Arabic font for Arabic, Unicode for others)
-            use_unicode_for_desc = should_use_unicode_font(lang_code, desc)
-            if use_unicode_for_desc:
-                # For Arabic, prefer Arabic font, then Unicode font, then fallback
-                registered_fonts = pdfmetrics.getRegisteredFontNames()
-                logger.debug("Registered fonts for Arabic description: %s", registered_fonts)
-                if "ArabicFont" in registered_fonts:
-                    desc_font_to_use = "ArabicFont"
-                    logger.info("Using ArabicFont for Arabic description (lang: %s): %s", lang_code, desc[:50])
-                elif unicode_font and unicode_font in registered_fonts:
-                    desc_font_to_use = unicode_font
-                    logger.warning("ArabicFont not found, using Unicode font '%s' for Arabic description (lang: %s): %s", 
-                                 unicode_font, lang_code, desc[:50])
-                else:
-                    # Fallback: try to use any registered Unicode-supporting font
-                    unicode_candidates = [f for f in registered_fonts if 'Unicode' in f or 'Noto' in f or 'Arial' in f or 'Arabic' in f]
-                    if unicode_candidates:
-                        desc_font_to_use = unicode_candidates[0]
-                        logger.warning("Arabic font not found for description, using fallback: %s for Arabic text (lang: %s)", desc_font_to_use, lang_code)
-                    else:
-                        desc_font_to_use = desc_font
-                        logger.error("No Unicode font available for Arabic description (lang: %s), using default font (may not render correctly): %s", 
-                                   lang_code, desc_font_to_use)
-            else:
-                desc_font_to_use = desc_font
+            desc_font_to_use = _arabic_font(unicode_font, desc_font) if use_unicode_for_desc else desc_font
             
             # If title is not included, show flag and use black color but keep smaller font
             if not include_title:
                 # Load language flag image (same logic as for title, but sized for desc font)
-                flag_image_path = get_language_flag_image_path(lang_code)
-                flag_image_data = None
-                flag_width = 0
-                flag_height = desc_font_size * 1.5
-                
-                if flag_image_path and flag_image_path.exists():
-                    try:
-                        logger.debug("Loading flag image for %s from %s", lang_code, flag_image_path)
-                        pil_flag = Image.open(flag_image_path)
-                        logger.debug("Flag image loaded: %dx%d pixels", pil_flag.width, pil_flag.height)
-                        flag_aspect = pil_flag.width / pil_flag.height
-                        flag_width = flag_height * flag_aspect
-                        logger.debug("Flag image will be rendered at %fx%f points", flag_width, flag_height)
-                        target_width_px = max(int(flag_width * 3), 1)
-                        target_height_px = max(int(flag_height * 3), 1)
-                        if pil_flag.size != (target_width_px, target_height_px):
-                            pil_flag = pil_flag.resize((target_width_px, target_height_px), Image.Resampling.LANCZOS)
-                        
-                        flag_corner_radius_px = max(2 * 3, min(int(flag_height * 0.15 * 3), 4 * 3))
-                        pil_flag = apply_rounded_corners(pil_flag, flag_corner_radius_px)
-                        
-                        flag_buffer = BytesIO()
-                        pil_flag.save(flag_buffer, format="PNG", compress_level=0, optimize=False)
-                        flag_buffer.seek(0)
-                        flag_image_data = flag_buffer
-                        logger.debug("Flag image processed and ready for rendering")
-                    except Exception as e:
-                        logger.warning("Failed to load language flag image for %s from %s: %s", lang_code, flag_image_path, str(e))
-                        import traceback
-                        logger.debug("Traceback: %s", traceback.format_exc())
-                        flag_image_data = None
-                else:
-                    logger.warning("Language flag image not found for %s (checked path: %s)", lang_code, flag_image_path)
+                flag_height = desc_flag_height
+                flag_reader, flag_width = _get_flag_image(lang_code, flag_height)
                 
                 # Set flag spacing after flag image is loaded
-                desc_flag_spacing = flag_spacing if flag_image_data else 0
-                
-                # Use description font size but black color when title is not included
-                c.setFont(desc_font_to_use, desc_font_size)
-                c.setFillColor(HexColor("#000000"))  # Black color, same as title
+                desc_flag_spacing = flag_spacing if flag_reader else 0
                 
                 # Use 80% width container (same as normal description)
-                desc_container_width = (width - 2 * margin) * 0.8
+                desc_container_width = content_width * 0.8
                 # Account for flag in the 80% width
                 max_width_text = desc_container_width - flag_width - desc_flag_spacing
                 
-                words = desc.split()
-                desc_lines = []
-                current_line = ""
+                desc_line_height = desc_font_size + line_spacing
+                desc_lines = _wrap_words(desc, desc_font_to_use, desc_font_size, max_width_text)
+                # Lines below the card's bottom edge are never visible: skip drawing them,
+                # but still advance y past every line so the layout below is unchanged
+                visible_desc_lines = desc_lines[:_lines_above(y, offset_y, desc_line_height)]
                 
-                for word in words:
-                    test_line = f"{current_line} {word}".strip()
-                    if c.stringWidth(test_line, desc_font_to_use, desc_font_size) <= max_width_text:
-                        current_line = test_line
-                    else:
-                        if current_line:
-                            desc_lines.append(current_line)
-                        current_line = word
+                # Lines go into the side's shared text object (style ops are only emitted on change);
+                # once the text object has failed they are drawn on the page with its font and color
+                if use_text_object:
+                    side_text_style = _set_text_style(side_textobj, side_text_style, desc_font_to_use, desc_font_size, _BLACK)
+                else:
+                    c.setFont(desc_font_to_use, desc_font_size)
+                    c.setFillColor(_BLACK)
                 
-                if current_line:
-                    desc_lines.append(current_line)
+                # Every line is centered within the 80% container as if prefixed by the flag
+                flag_prefix_width = flag_width + desc_flag_spacing
                 
                 # Draw description lines with flag image prefix
-                for line_idx, line in enumerate(desc_lines):
+                for line_idx, line in enumerate(visible_desc_lines):
+                    # Baselines step down by a fixed line height from the first one
+                    line_y = y - line_idx * desc_line_height
                     
                     # Calculate total width (flag + space + text) within 80% container
-                    text_width = c.stringWidth(line, desc_font_to_use, desc_font_size)
-                    total_width = flag_width + desc_flag_spacing + text_width if flag_image_data else text_width
+                    text_width = _text_width(line, desc_font_to_use, desc_font_size)
+                    total_width = flag_prefix_width + text_width
                     
                     # Center the entire line (flag + text) within the 80% container
-                    container_x = offset_x + (width - desc_container_width) / 2
-                    line_x = container_x + (desc_container_width - total_width) / 2 if flag_image_data else container_x + (desc_container_width - text_width) / 2
+                    line_x = center_x - total_width * 0.5
                     
                     # Draw flag image (only on first line)
-                    if line_idx == 0 and flag_image_data:
+                    if line_idx == 0 and flag_reader:
                         try:
-                            ascent = pdfmetrics.getAscent(desc_font_to_use) * desc_font_size / 1000.0
+                            ascent = _ascent(desc_font_to_use, desc_font_size)
                             offset = desc_font_size * 0.22
-                            flag_y = y + ascent - flag_height - offset
-                            c.drawImage(ImageReader(flag_image_data), line_x, flag_y, width=flag_width, height=flag_height, mask='auto')
-                            logger.debug(
-                                "Drew flag image for description %s at (%.2f, %.2f) with size (%.2f, %.2f)",
-                                lang_code, line_x, flag_y, flag_width, flag_height
-                            )
+                            flag_y = line_y + ascent - flag_height - offset
+                            c.drawImage(flag_reader, line_x, flag_y, width=flag_width, height=flag_height, mask='auto')
                         except Exception as e:
                             logger.warning("Failed to draw language flag image: %s", str(e))
                     
                     # Draw text
-                    c.setFont(desc_font_to_use, desc_font_size)
-                    c.setFillColor(HexColor("#000000"))
-                    text_x = line_x + flag_width + desc_flag_spacing if (line_idx == 0 and flag_image_data) else line_x
+                    text_x = line_x + flag_width + desc_flag_spacing if (line_idx == 0 and flag_reader) else line_x
                     
-                    # For Arabic/RTL text, use text object for better rendering
-                    if use_unicode_for_desc and contains_arabic_characters(line):
+                    if use_text_object:
                         try:
-                            textobj = c.beginText()
-                            textobj.setFont(desc_font_to_use, desc_font_size)
-                            textobj.setFillColor(HexColor("#000000"))
-                            textobj.setTextOrigin(text_x, y)
-                            textobj.textLine(line)
-                            c.drawText(textobj)
+                            side_textobj.setTextOrigin(text_x, line_y)
+                            side_textobj.textLine(line)
                         except Exception as e:
-                            logger.warning("Failed to draw Arabic description with text object, falling back: %s", str(e))
-                            c.drawString(text_x, y, line)
-                    else:
-                        c.drawString(text_x, y, line)
-                    y -= desc_font_size + line_spacing
+                            # Don't retry the text object after a failure; later lines use drawString
+                            logger.warning("Failed to draw description with text object, falling back: %s", str(e))
+                            use_text_object = False
+                            c.setFont(desc_font_to_use, desc_font_size)
+                            c.setFillColor(_BLACK)
+                    if not use_text_object:
+                        c.drawString(text_x, line_y, line)
+                y -= len(desc_lines) * desc_line_height
             else:
                 # Title is included, use normal description styling
-                c.setFont(desc_font_to_use, desc_font_size)
-                c.setFillColor(HexColor("#999999"))  # Grey color
-                
                 # Use narrower width for description container (80% of available width)
-                desc_container_width = (width - 2 * margin) * 0.7
+                desc_container_width = content_width * 0.7
                 
                 # Word wrap description within container
-                words = desc.split()
-                desc_lines = []
-                current_line = ""
-                
-                for word in words:
-                    test_line = f"{current_line} {word}".strip()
-                    if c.stringWidth(test_line, desc_font_to_use, desc_font_size) <= desc_container_width:
-                        current_line = test_line
-                    else:
-                        if current_line:
-                            desc_lines.append(current_line)
-                        current_line = word
+                desc_line_height = desc_font_size + line_spacing
+                desc_lines = _wrap_words(desc, desc_font_to_use, desc_font_size, desc_container_width)
+                # Lines below the card's bottom edge are never visible: skip drawing them,
+                # but still advance y past every line so the layout below is unchanged
+                visible_desc_lines = desc_lines[:_lines_above(y, offset_y, desc_line_height)]
                 
-                if current_line:
-                    desc_lines.append(current_line)
+                # Lines go into the side's shared text object (style ops are only emitted on change);
+                # once the text object has failed they are drawn on the page with its font and color
+                if use_text_object:
+                    side_text_style = _set_text_style(side_textobj, side_text_style, desc_font_to_use, desc_font_size, _DESC_GRAY)
+                else:
+                    c.setFont(desc_font_to_use, desc_font_size)
+                    c.setFillColor(_DESC_GRAY)
                 
                 # Draw description lines (centered within container)
-                for line in desc_lines:
-                    line_width = c.stringWidth(line, desc_font_to_use, desc_font_size)
-                    line_x = offset_x + (width - line_width) / 2
+                for line_idx, line in enumerate(visible_desc_lines):
+                    # Baselines step down by a fixed line height from the first one
+                    line_y = y - line_idx * desc_line_height
+                    line_width = _text_width(line, desc_font_to_use, desc_font_size)
+                    line_x = center_x - line_width * 0.5
                     
-                    # For Arabic/RTL text, use text object for better rendering
-                    if use_unicode_for_desc and contains_arabic_characters(line):
+                    if use_text_object:
                         try:
-                            textobj = c.beginText()
-                            textobj.setFont(desc_font_to_use, desc_font_size)
-                            textobj.setFillColor(HexColor("#999999"))
-                            textobj.setTextOrigin(line_x, y)
-                            textobj.textLine(line)
-                            c.drawText(textobj)
+                            side_textobj.setTextOrigin(line_x, line_y)
+                            side_textobj.textLine(line)
                         except Exception as e:
-                            logger.warning("Failed to draw Arabic description with text object, falling back: %s", str(e))
-                            c.drawString(line_x, y, line)
-                    else:
-                        c.drawString(line_x, y, line)
-                    y -= desc_font_size + line_spacing
+                            # Don't retry the text object after a failure; later lines use drawString
+                            logger.warning("Failed to draw description with text object, falling back: %s", str(e))
+                            use_text_object = False
+                            c.setFont(desc_font_to_use, desc_font_size)
+                            c.setFillColor(_DESC_GRAY)
+                    if not use_text_object:
+                        c.drawString(line_x, line_y, line)
+                y -= len(desc_lines) * desc_line_height
         
         y -= language_spacing  # Scaled spacing between languages
+    
+    # Only flush the text object if a title or description line went into it
+    if side_text_style is not None:
+        c.drawText(side_textobj)
+
+
 def draw_card_side_a8_landscape(
     c: canvas.Canvas,
     concept: Concept,
@@ -748,110 +1011,47 @@ def draw_card_side_a8_landscape(
             a8_portrait = A8
             width, height = a8_portrait[1], a8_portrait[0]  # Swap for landscape
     
-    # Use A8 portrait as reference size for scaling calculations
-    # A8 portrait dimensions: 52mm x 74mm = 147.40 x 209.76 points (at 72 DPI)
-    # A8 landscape: 74mm x 52mm = 209.76 x 147.40 points
-    ref_width_landscape = A8[1]  # Height becomes width in landscape
-    
-    # Calculate scale factor based on width ratio
-    scale_factor = width / ref_width_landscape
+    # Index lemmas by language once instead of scanning the list per language
+    lemmas_by_lang = _lemmas_by_language(lemmas)
     
-    # Scale all dimensions proportionally
-    # Base values (for A8 landscape reference size)
-    base_margin = 7 * mm  # Smaller margin for A8
-    base_title_font_size = 12  # Increased from 10
-    base_icon_size = 12
-    base_flag_spacing = 4
-    base_line_spacing = 3  # Increased from 1.5 (more vertical spacing for title & description)
-    base_language_spacing = 32
-    base_corner_radius = 3 * mm
-    
-    # Calculate font scaling based on number of languages and image presence
     # Count languages that will actually be displayed (have lemmas)
-    num_languages = sum(1 for lang_code in languages 
-                       if next((l for l in lemmas if l.language_code.lower() == lang_code.lower()), None) is not None)
+    num_languages = sum(1 for lang_code in languages if lang_code.lower() in lemmas_by_lang)
     
     # Check if image will be displayed
     has_image = include_image and concept.image_url is not None
     
-    # Calculate language-based font scale factor
-    # If image given: 3 languages = 1.0, 2 = bigger, 1 = even bigger
-    # If image not given: 5 languages = 1.0, 4 = bigger, 3 = even bigger, etc.
-    if has_image:
-        # With image: 3 languages is baseline (1.0), scale up for fewer languages
-        if num_languages >= 3:
-            language_font_scale = 1.0
-        elif num_languages == 2:
-            # Scale linearly bigger: 3 -> 2 is 1.5x the difference
-            language_font_scale = 1.0 + (1.0 / 3.0)  # 1.333...
-        elif num_languages == 1:
-            # Even bigger: 3 -> 1 is 2x the difference
-            language_font_scale = 1.0 + (2.0 / 3.0)  # 1.667...
-        else:
-            language_font_scale = 1.0
-    else:
-        # Without image: 5 languages is baseline (1.0), scale up for fewer languages
-        if num_languages >= 5:
-            language_font_scale = 1.0
-        elif num_languages == 4:
-            # Scale linearly bigger: 5 -> 4 is 1.25x
-            language_font_scale = 1.0 + (1.0 / 5.0)  # 1.2
-        elif num_languages == 3:
-            # 5 -> 3 is 1.4x
-            language_font_scale = 1.0 + (2.0 / 5.0)  # 1.4
-        elif num_languages == 2:
-            # 5 -> 2 is 1.6x
-            language_font_scale = 1.0 + (3.0 / 5.0)  # 1.6
-        elif num_languages == 1:
-            # 5 -> 1 is 1.8x
-            language_font_scale = 1.0 + (4.0 / 5.0)  # 1.8
-        else:
-            language_font_scale = 1.0
+    # Scaled dimensions (cached per card shape)
+    layout = _compute_layout_a8((width, height), num_languages, has_image, include_title)
+    scale_factor = layout.scale_factor
+    language_font_scale = layout.language_font_scale
+    margin = layout.margin
+    title_font_size = layout.title_font_size
+    ipa_font_size = layout.ipa_font_size
+    desc_font_size = layout.desc_font_size
+    icon_size = layout.icon_size
+    flag_spacing = layout.flag_spacing
+    line_spacing = layout.line_spacing
+    language_spacing = layout.language_spacing
+    image_margin_top = layout.image_margin_top
+    image_margin_bottom = layout.image_margin_bottom
+    content_margin = layout.content_margin
     
-    # Scaled values
-    margin = base_margin * scale_factor
-    title_font_size = base_title_font_size * scale_factor * language_font_scale
-    # IPA font size is 50% of title font size
-    ipa_font_size = title_font_size * 0.7
-    # Description font size: 50% of title if title is present, 80% if not
-    desc_font_size = title_font_size * (0.7 if include_title else 0.9)
-    icon_size = base_icon_size * scale_factor
-    flag_spacing = base_flag_spacing * scale_factor
-    # Scale line spacing (between title/description/IPA lines) with language count
-    line_spacing = base_line_spacing * scale_factor * language_font_scale
-    # Scale language spacing (between languages) with language count
-    language_spacing = base_language_spacing * scale_factor * language_font_scale
-    
-    # Layout: Image at top (60% width, centered), content below
-    image_width_percent = 0.80  # 70% of page width (increased from 50% to reduce side whitespace)
-    image_margin_top = margin * 2  # Reduced from 2.5 (less whitespace above)
-    # Scale image margin bottom (spacing between image and content) with language count
-    image_margin_bottom = margin * 2 * language_font_scale  # Increased from 1.5 (more space between image and text)
-    content_margin = margin * 0.95
-    
-    # Register Unicode fonts for IPA symbols and emojis
-    unicode_font, emoji_font = register_unicode_fonts()
-    title_font, desc_font, ipa_font = register_flashcard_fonts()
-    
-    # Log registered fonts for debugging
-    registered_fonts = pdfmetrics.getRegisteredFontNames()
-    logger.info("All registered fonts: %s", registered_fonts)
-    logger.info(
-        "Using fonts - Title: %s, Description: %s, IPA: %s, Unicode: %s, Emoji: %s",
-        title_font, desc_font, ipa_font, unicode_font, emoji_font
-    )
+    # Unicode fonts for IPA symbols and emojis, display fonts for title/description
+    unicode_font, emoji_font, title_font, desc_font, ipa_font = _ensure_fonts_registered()
+    # Set lookups for the font checks below, instead of listing the registry each time
+    registered_fonts = _registered_font_set
     
     # Clear background (at offset position)
-    c.setFillColor(HexColor("#FFFFFF"))
+    c.setFillColor(_WHITE)
     c.rect(offset_x, offset_y, width, height, fill=1, stroke=0)
     
     # Topic icon at top right (subtle) - use emoji font if available
     if topic and topic.icon:
         icon_drawn = False
-        if emoji_font and emoji_font in pdfmetrics.getRegisteredFontNames():
+        if emoji_font and emoji_font in registered_fonts:
             try:
                 c.setFont(emoji_font, icon_size)
-                c.setFillColor(HexColor("#CCCCCC"))  # Subtle gray
+                c.setFillColor(_ICON_GRAY)  # Subtle gray
                 icon_width = c.stringWidth(topic.icon, emoji_font, icon_size)
                 icon_x = offset_x + width - margin - icon_width
                 icon_y = offset_y + height - margin - icon_size
@@ -860,10 +1060,10 @@ def draw_card_side_a8_landscape(
             except Exception as e:
                 logger.debug("Failed to draw topic icon with emoji font: %s", str(e))
         
-        if not icon_drawn and unicode_font and unicode_font in pdfmetrics.getRegisteredFontNames():
+        if not icon_drawn and unicode_font and unicode_font in registered_fonts:
             try:
                 c.setFont(unicode_font, icon_size)
-                c.setFillColor(HexColor("#CCCCCC"))  # Subtle gray
+                c.setFillColor(_ICON_GRAY)  # Subtle gray
                 icon_width = c.stringWidth(topic.icon, unicode_font, icon_size)
                 icon_x = offset_x + width - margin - icon_width
                 icon_y = offset_y + height - margin - icon_size
@@ -877,14 +1077,14 @@ def draw_card_side_a8_landscape(
     y = offset_y + height - image_margin_top
     
     if include_image and concept.image_url:
-        image_data = download_image(concept.image_url)
-        if image_data:
+        image_bytes = download_image_bytes(concept.image_url)
+        if image_bytes:
             try:
-                # Open with PIL to resize
-                pil_image = Image.open(image_data)
+                # Open lazily to read the size; pixels are only decoded on a cache miss
+                pil_image = Image.open(BytesIO(image_bytes))
                 
                 # Image width is 50% of page width
-                max_width = width * image_width_percent
+                max_width = width * _A8_IMAGE_WIDTH_PERCENT
                 max_image_height = height * 0.4  # Max 40% of page height
                 
                 # Maintain aspect ratio
@@ -909,28 +1109,20 @@ def draw_card_side_a8_landscape(
                 render_width_px = max(int(target_width_px * supersample_factor), 1)
                 render_height_px = max(int(target_height_px * supersample_factor), 1)
                 
-                # Resize with high-quality resampling
-                if pil_image.size != (render_width_px, render_height_px):
-                    pil_image = pil_image.resize((render_width_px, render_height_px), Image.Resampling.LANCZOS)
-                
                 # Add rounded corners
-                corner_radius_scaled = base_corner_radius * scale_factor
+                corner_radius_scaled = layout.corner_radius
                 corner_radius_px = int((corner_radius_scaled / width) * new_width * supersample_factor)
                 min_radius = 4 * supersample_factor
                 max_radius = 20 * supersample_factor * scale_factor
                 corner_radius_px = max(min_radius, min(corner_radius_px, max_radius))
                 
-                pil_image = apply_rounded_corners(pil_image, corner_radius_px)
-                
-                # Save to BytesIO
-                img_buffer = BytesIO()
-                pil_image.save(img_buffer, format="PNG", compress_level=0, optimize=False)
-                img_buffer.seek(0)
+                # Resize and round the corners (cached, shared by front and back)
+                image_reader = _prepare_concept_image(image_bytes, render_width_px, render_height_px, corner_radius_px)
                 
                 # Center image horizontally
                 image_x = offset_x + (width - new_width) / 2
                 image_y = y - new_height
-                c.drawImage(ImageReader(img_buffer), image_x, image_y, width=new_width, height=new_height, mask='auto')
+                c.drawImage(image_reader, image_x, image_y, width=new_width, height=new_height, mask='auto')
                 y = image_y - image_margin_bottom  # Move y below image
             except Exception as e:
                 logger.warning("Failed to draw image for concept %d: %s", concept.id, str(e))
@@ -946,10 +1138,25 @@ def draw_card_side_a8_landscape(
     if not include_image:
         y -= image_margin_bottom * 0.25
 
+    # Horizontal center of the card; every centered line is placed relative to it
+    center_x = offset_x + width * 0.5
+    
+    # Title and description lines of every language go into one text object, drawn after the loop
+    side_textobj = c.beginText()
+    side_text_style: Optional[Tuple[str, float, Color]] = None
+    use_text_object = True
+    
+    # A side without title, IPA or description (e.g. image only) has no per-language work
+    text_languages = languages if (include_title or include_ipa or include_description) else []
+    
+    # Flag sizes are the same for every language
+    title_flag_height = title_font_size * 0.85
+    desc_flag_height = desc_font_size * 1.5
+    
     # Draw lemmas for each language
-    for lang_code in languages:
+    for lang_code in text_languages:
         # Find lemma for this language
-        lemma = next((l for l in lemmas if l.language_code.lower() == lang_code.lower()), None)
+        lemma = lemmas_by_lang.get(lang_code.lower())
         if not lemma:
             continue
         
@@ -957,110 +1164,89 @@ def draw_card_side_a8_landscape(
         if include_title:
             translation_text = decode_html_entities(lemma.term)
             
-            # Process Arabic text for proper rendering
-            if should_use_unicode_font(lang_code, translation_text):
+            # Process Arabic text for proper rendering (decided once per lemma)
+            use_unicode_for_title = should_use_unicode_font(lang_code, translation_text)
+            if use_unicode_for_title:
                 translation_text = process_arabic_text(translation_text)
             
             # Get language flag image
-            flag_image_path = get_language_flag_image_path(lang_code)
-            flag_image_data = None
-            flag_width = 0
-            flag_height = title_font_size * 0.85
-            
-            if flag_image_path and flag_image_path.exists():
-                try:
-                    pil_flag = Image.open(flag_image_path)
-                    flag_aspect = pil_flag.width / pil_flag.height
-                    flag_width = flag_height * flag_aspect
-                    target_width_px = max(int(flag_width * 3), 1)
-                    target_height_px = max(int(flag_height * 3), 1)
-                    if pil_flag.size != (target_width_px, target_height_px):
-                        pil_flag = pil_flag.resize((target_width_px, target_height_px), Image.Resampling.LANCZOS)
-                    
-                    flag_corner_radius_px = max(2 * 3, min(int(flag_height * 0.15 * 3), 4 * 3))
-                    pil_flag = apply_rounded_corners(pil_flag, flag_corner_radius_px)
-                    
-                    flag_buffer = BytesIO()
-                    pil_flag.save(flag_buffer, format="PNG", compress_level=0, optimize=False)
-                    flag_buffer.seek(0)
-                    flag_image_data = flag_buffer
-                except Exception as e:
-                    logger.warning("Failed to load language flag image for %s: %s", lang_code, str(e))
-                    flag_image_data = None
+            flag_height = title_flag_height
+            flag_reader, flag_width = _get_flag_image(lang_code, flag_height)
             
             # Determine which font to use
-            use_unicode_for_title = should_use_unicode_font(lang_code, translation_text)
-            if use_unicode_for_title:
-                registered_fonts = pdfmetrics.getRegisteredFontNames()
-                if "ArabicFont" in registered_fonts:
-                    title_font_to_use = "ArabicFont"
-                elif unicode_font and unicode_font in registered_fonts:
-                    title_font_to_use = unicode_font
-                else:
-                    unicode_candidates = [f for f in registered_fonts if 'Unicode' in f or 'Noto' in f or 'Arial' in f or 'Arabic' in f]
-                    title_font_to_use = unicode_candidates[0] if unicode_candidates else title_font
-            else:
-                title_font_to_use = title_font
+            title_font_to_use = _arabic_font(unicode_font, title_font) if use_unicode_for_title else title_font
+            
+            # RTL rendering is a property of the whole title, not of each wrapped line
+            title_is_arabic = use_unicode_for_title and contains_arabic_characters(translation_text)
             
             # Word wrap for translation text
-            c.setFont(title_font_to_use, title_font_size)
-            words = translation_text.split()
-            lines = []
-            current_line = ""
-            current_flag_spacing = flag_spacing if flag_image_data else 0
+            current_flag_spacing = flag_spacing if flag_reader else 0
             max_width_text = content_available_width - flag_width - current_flag_spacing
+            lines = _wrap_words(translation_text, title_font_to_use, title_font_size, max_width_text)
             
-            for word in words:
-                test_line = f"{current_line} {word}".strip()
-                if c.stringWidth(test_line, title_font_to_use, title_font_size) <= max_width_text:
-                    current_line = test_line
-                else:
-                    if current_line:
-                        lines.append(current_line)
-                    current_line = word
+            # Non-Arabic lines go into the side's shared text object; Arabic lines, and every
+            # line once the text object has failed, are drawn on the page with its font and color
+            if title_is_arabic or not use_text_object:
+                c.setFont(title_font_to_use, title_font_size)
+                c.setFillColor(_BLACK)
+            else:
+                side_text_style = _set_text_style(side_textobj, side_text_style, title_font_to_use, title_font_size, _BLACK)
+            # Arabic lines use drawString until the title font fails once, then Helvetica
+            arabic_font_ok = True
             
-            if current_line:
-                lines.append(current_line)
+            # Every line is centered as if prefixed by the flag (0 when there is no flag)
+            flag_prefix_width = flag_width + current_flag_spacing
             
             # Draw translation lines with flag image prefix (centered)
             for line_idx, line in enumerate(lines):
                 
                 # Calculate total width (flag + space + text)
-                text_width = c.stringWidth(line, title_font_to_use, title_font_size)
-                total_width = flag_width + current_flag_spacing + text_width if flag_image_data else text_width
+                text_width = _text_width(line, title_font_to_use, title_font_size)
+                total_width = flag_prefix_width + text_width
                 
                 # Center the entire line (flag + text)
-                line_x = offset_x + (width - total_width) / 2
+                line_x = center_x - total_width * 0.5
                 
                 # Draw flag image (only on first line)
-                if line_idx == 0 and flag_image_data:
+                if line_idx == 0 and flag_reader:
                     try:
-                        ascent = pdfmetrics.getAscent(title_font_to_use) * title_font_size / 1000.0
+                        ascent = _ascent(title_font_to_use, title_font_size)
                         offset = title_font_size * 0.22
                         flag_y = y + ascent - flag_height - offset
-                        c.drawImage(ImageReader(flag_image_data), line_x, flag_y, width=flag_width, height=flag_height, mask='auto')
+                        c.drawImage(flag_reader, line_x, flag_y, width=flag_width, height=flag_height, mask='auto')
                     except Exception as e:
                         logger.warning("Failed to draw language flag image: %s", str(e))
                 
                 # Draw text (centered with flag)
-                c.setFont(title_font_to_use, title_font_size)
-                c.setFillColor(HexColor("#000000"))
-                text_x = line_x + flag_width + current_flag_spacing if (line_idx == 0 and flag_image_data) else line_x
+                text_x = line_x + flag_width + current_flag_spacing if (line_idx == 0 and flag_reader) else line_x
                 
-                if use_unicode_for_title and contains_arabic_characters(line):
-                    try:
-                        c.setFont(title_font_to_use, title_font_size)
-                        c.setFillColor(HexColor("#000000"))
-                        c.drawString(text_x, y, line)
-                    except Exception as e:
-                        logger.error("Failed to draw Arabic text: %s", str(e))
+                if title_is_arabic:
+                    if arabic_font_ok:
                         try:
+                            c.drawString(text_x, y, line)
+                        except Exception as e:
+                            logger.error("Failed to draw Arabic text: %s", str(e))
+                            # Every line shares the font: send this and the remaining lines to the fallback
+                            arabic_font_ok = False
                             c.setFont("Helvetica", title_font_size)
+                    if not arabic_font_ok:
+                        try:
                             c.drawString(text_x, y, line)
-                        except:
+                        except Exception:
                             pass
                 else:
-                    c.drawString(text_x, y, line)
+                    if use_text_object:
+                        try:
+                            side_textobj.setTextOrigin(text_x, y)
+                            side_textobj.textLine(line)
+                        except Exception as e:
+                            # Don't retry the text object after a failure; later lines use drawString
+                            logger.warning("Failed to draw title with text object, falling back: %s", str(e))
+                            use_text_object = False
+                            c.setFont(title_font_to_use, title_font_size)
+                            c.setFillColor(_BLACK)
+                    if not use_text_object:
+                        c.drawString(text_x, y, line)
                 y -= title_font_size + line_spacing
             
             y -= line_spacing
@@ -1080,7 +1266,7 @@ def draw_card_side_a8_landscape(
             
             # Determine which font to use
             if ipa_font_to_use:
-                is_registered = ipa_font_to_use in pdfmetrics.getRegisteredFontNames()
+                is_registered = ipa_font_to_use in registered_fonts
                 is_builtin = ipa_font_to_use in builtin_fonts
                 
                 if not (is_registered or is_builtin):
@@ -1092,37 +1278,16 @@ def draw_card_side_a8_landscape(
             
             try:
                 c.setFont(ipa_font_to_use, ipa_font_size)
-                c.setFillColor(HexColor("#aaaaaa"))
+                c.setFillColor(_IPA_GRAY)
                 
                 # Improved word wrap for IPA text - ensure it uses full available width
                 # Split by spaces and wrap properly
-                words = ipa_text.split()
-                ipa_lines = []
-                current_line = ""
-                
-                for word in words:
-                    test_line = f"{current_line} {word}".strip() if current_line else word
-                    if c.stringWidth(test_line, ipa_font_to_use, ipa_font_size) <= content_available_width:
-                        current_line = test_line
-                    else:
-                        if current_line:
-                            ipa_lines.append(current_line)
-                        # If single word is too long, add it anyway (will overflow slightly but better than breaking IPA)
-                        if c.stringWidth(word, ipa_font_to_use, ipa_font_size) > content_available_width:
-                            ipa_lines.append(word)
-                            current_line = ""
-                        else:
-                            current_line = word
-                
-                if current_line:
-                    ipa_lines.append(current_line)
+                ipa_lines = _wrap_words(ipa_text, ipa_font_to_use, ipa_font_size, content_available_width)
                 
                 # Draw IPA lines (centered) - ensure proper wrapping
                 for line in ipa_lines:
-                    c.setFont(ipa_font_to_use, ipa_font_size)
-                    c.setFillColor(HexColor("#aaaaaa"))
-                    ipa_line_width = c.stringWidth(line, ipa_font_to_use, ipa_font_size)
-                    ipa_x = offset_x + (width - ipa_line_width) / 2
+                    ipa_line_width = _text_width(line, ipa_font_to_use, ipa_font_size)
+                    ipa_x = center_x - ipa_line_width * 0.5
                     c.drawString(ipa_x, y, line)
                     y -= ipa_font_size + line_spacing
                 
@@ -1137,153 +1302,117 @@ def draw_card_side_a8_landscape(
         if include_description and lemma.description:
             desc = decode_html_entities(lemma.description)
             
-            # Process Arabic text for proper rendering
-            if should_use_unicode_font(lang_code, desc):
+            # Process Arabic text for proper rendering (decided once per lemma)
+            use_unicode_for_desc = should_use_unicode_font(lang_code, desc)
+            if use_unicode_for_desc:
                 desc = process_arabic_text(desc)
             
             # Determine which font to use
-            use_unicode_for_desc = should_use_unicode_font(lang_code, desc)
-            if use_unicode_for_desc:
-                registered_fonts = pdfmetrics.getRegisteredFontNames()
-                if "ArabicFont" in registered_fonts:
-                    desc_font_to_use = "ArabicFont"
-                elif unicode_font and unicode_font in registered_fonts:
-                    desc_font_to_use = unicode_font
-                else:
-                    unicode_candidates = [f for f in registered_fonts if 'Unicode' in f or 'Noto' in f or 'Arial' in f or 'Arabic' in f]
-                    desc_font_to_use = unicode_candidates[0] if unicode_candidates else desc_font
-            else:
-                desc_font_to_use = desc_font
+            desc_font_to_use = _arabic_font(unicode_font, desc_font) if use_unicode_for_desc else desc_font
             
             # If title is not included, show flag and use black color
             if not include_title:
-                flag_image_path = get_language_flag_image_path(lang_code)
-                flag_image_data = None
-                flag_width = 0
-                flag_height = desc_font_size * 1.5
-                
-                if flag_image_path and flag_image_path.exists():
-                    try:
-                        pil_flag = Image.open(flag_image_path)
-                        flag_aspect = pil_flag.width / pil_flag.height
-                        flag_width = flag_height * flag_aspect
-                        target_width_px = max(int(flag_width * 3), 1)
-                        target_height_px = max(int(flag_height * 3), 1)
-                        if pil_flag.size != (target_width_px, target_height_px):
-                            pil_flag = pil_flag.resize((target_width_px, target_height_px), Image.Resampling.LANCZOS)
-                        
-                        flag_corner_radius_px = max(2 * 3, min(int(flag_height * 0.15 * 3), 4 * 3))
-                        pil_flag = apply_rounded_corners(pil_flag, flag_corner_radius_px)
-                        
-                        flag_buffer = BytesIO()
-                        pil_flag.save(flag_buffer, format="PNG", compress_level=0, optimize=False)
-                        flag_buffer.seek(0)
-                        flag_image_data = flag_buffer
-                    except Exception as e:
-                        logger.warning("Failed to load language flag image for %s: %s", lang_code, str(e))
-                        flag_image_data = None
-                
-                desc_flag_spacing = flag_spacing if flag_image_data else 0
-                c.setFont(desc_font_to_use, desc_font_size)
-                c.setFillColor(HexColor("#000000"))
+                flag_height = desc_flag_height
+                flag_reader, flag_width = _get_flag_image(lang_code, flag_height)
                 
+                desc_flag_spacing = flag_spacing if flag_reader else 0
                 max_width_text = content_available_width - flag_width - desc_flag_spacing
                 
-                words = desc.split()
-                desc_lines = []
-                current_line = ""
+                desc_line_height = desc_font_size + line_spacing
+                desc_lines = _wrap_words(desc, desc_font_to_use, desc_font_size, max_width_text)
+                # Lines below the card's bottom edge are never visible: skip drawing them,
+                # but still advance y past every line so the layout below is unchanged
+                visible_desc_lines = desc_lines[:_lines_above(y, offset_y, desc_line_height)]
                 
-                for word in words:
-                    test_line = f"{current_line} {word}".strip()
-                    if c.stringWidth(test_line, desc_font_to_use, desc_font_size) <= max_width_text:
-                        current_line = test_line
-                    else:
-                        if current_line:
-                            desc_lines.append(current_line)
-                        current_line = word
+                # Lines go into the side's shared text object (style ops are only emitted on change);
+                # once the text object has failed they are drawn on the page with its font and color
+                if use_text_object:
+                    side_text_style = _set_text_style(side_textobj, side_text_style, desc_font_to_use, desc_font_size, _BLACK)
+                else:
+                    c.setFont(desc_font_to_use, desc_font_size)
+                    c.setFillColor(_BLACK)
                 
-                if current_line:
-                    desc_lines.append(current_line)
+                # Every line is centered as if prefixed by the flag (0 when there is no flag)
+                flag_prefix_width = flag_width + desc_flag_spacing
                 
                 # Draw description lines with flag image prefix (centered)
-                for line_idx, line in enumerate(desc_lines):
+                for line_idx, line in enumerate(visible_desc_lines):
+                    # Baselines step down by a fixed line height from the first one
+                    line_y = y - line_idx * desc_line_height
                     # Calculate total width (flag + space + text)
-                    text_width = c.stringWidth(line, desc_font_to_use, desc_font_size)
-                    total_width = flag_width + desc_flag_spacing + text_width if flag_image_data else text_width
+                    text_width = _text_width(line, desc_font_to_use, desc_font_size)
+                    total_width = flag_prefix_width + text_width
                     
                     # Center the entire line (flag + text)
-                    line_x = offset_x + (width - total_width) / 2
+                    line_x = center_x - total_width * 0.5
                     
                     # Draw flag image (only on first line)
-                    if line_idx == 0 and flag_image_data:
+                    if line_idx == 0 and flag_reader:
                         try:
-                            ascent = pdfmetrics.getAscent(desc_font_to_use) * desc_font_size / 1000.0
+                            ascent = _ascent(desc_font_to_use, desc_font_size)
                             offset = desc_font_size * 0.22
-                            flag_y = y + ascent - flag_height - offset
-                            c.drawImage(ImageReader(flag_image_data), line_x, flag_y, width=flag_width, height=flag_height, mask='auto')
+                            flag_y = line_y + ascent - flag_height - offset
+                            c.drawImage(flag_reader, line_x, flag_y, width=flag_width, height=flag_height, mask='auto')
                         except Exception as e:
                             logger.warning("Failed to draw language flag image: %s", str(e))
                     
                     # Draw text (centered with flag)
-                    c.setFont(desc_font_to_use, desc_font_size)
-                    c.setFillColor(HexColor("#000000"))
-                    text_x = line_x + flag_width + desc_flag_spacing if (line_idx == 0 and flag_image_data) else line_x
+                    text_x = line_x + flag_width + desc_flag_spacing if (line_idx == 0 and flag_reader) else line_x
                     
-                    if use_unicode_for_desc and contains_arabic_characters(line):
+                    if use_text_object:
                         try:
-                            textobj = c.beginText()
-                            textobj.setFont(desc_font_to_use, desc_font_size)
-                            textobj.setFillColor(HexColor("#000000"))
-                            textobj.setTextOrigin(text_x, y)
-                            textobj.textLine(line)
-                            c.drawText(textobj)
+                            side_textobj.setTextOrigin(text_x, line_y)
+                            side_textobj.textLine(line)
                         except Exception as e:
-                            logger.warning("Failed to draw Arabic description with text object, falling back: %s", str(e))
-                            c.drawString(text_x, y, line)
-                    else:
-                        c.drawString(text_x, y, line)
-                    y -= desc_font_size + line_spacing
+                            # Don't retry the text object after a failure; later lines use drawString
+                            logger.warning("Failed to draw description with text object, falling back: %s", str(e))
+                            use_text_object = False
+                            c.setFont(desc_font_to_use, desc_font_size)
+                            c.setFillColor(_BLACK)
+                    if not use_text_object:
+                        c.drawString(text_x, line_y, line)
+                y -= len(desc_lines) * desc_line_height
             else:
                 # Title is included, use normal description styling
-                c.setFont(desc_font_to_use, desc_font_size)
-                c.setFillColor(HexColor("#666666"))  # Darker grey color (was #999999)
-                
                 # Word wrap description
-                words = desc.split()
-                desc_lines = []
-                current_line = ""
-                
-                for word in words:
-                    test_line = f"{current_line} {word}".strip()
-                    if c.stringWidth(test_line, desc_font_to_use, desc_font_size) <= content_available_width:
-                        current_line = test_line
-                    else:
-                        if current_line:
-                            desc_lines.append(current_line)
-                        current_line = word
+                desc_line_height = desc_font_size + line_spacing
+                desc_lines = _wrap_words(desc, desc_font_to_use, desc_font_size, content_available_width)
+                # Lines below the card's bottom edge are never visible: skip drawing them,
+                # but still advance y past every line so the layout below is unchanged
+                visible_desc_lines = desc_lines[:_lines_above(y, offset_y, desc_line_height)]
                 
-                if current_line:
-                    desc_lines.append(current_line)
+                # Lines go into the side's shared text object (style ops are only emitted on change);
+                # once the text object has failed they are drawn on the page with its font and color
+                if use_text_object:
+                    side_text_style = _set_text_style(side_textobj, side_text_style, desc_font_to_use, desc_font_size, _A8_DESC_GRAY)
+                else:
+                    c.setFont(desc_font_to_use, desc_font_size)
+                    c.setFillColor(_A8_DESC_GRAY)
                 
                 # Draw description lines (centered)
-                for line in desc_lines:
-                    line_width = c.stringWidth(line, desc_font_to_use, desc_font_size)
-                    line_x = offset_x + (width - line_width) / 2
+                for line_idx, line in enumerate(visible_desc_lines):
+                    # Baselines step down by a fixed line height from the first one
+                    line_y = y - line_idx * desc_line_height
+                    line_width = _text_width(line, desc_font_to_use, desc_font_size)
+                    line_x = center_x - line_width * 0.5
                     
-                    if use_unicode_for_desc and contains_arabic_characters(line):
+                    if use_text_object:
                         try:
-                            textobj = c.beginText()
-                            textobj.setFont(desc_font_to_use, desc_font_size)
-                            textobj.setFillColor(HexColor("#666666"))  # Darker grey color (was #999999)
-                            textobj.setTextOrigin(line_x, y)
-                            textobj.textLine(line)
-                            c.drawText(textobj)
+                            side_textobj.setTextOrigin(line_x, line_y)
+                            side_textobj.textLine(line)
                         except Exception as e:
-                            logger.warning("Failed to draw Arabic description with text object, falling back: %s", str(e))
-                            c.drawString(line_x, y, line)
-                    else:
-                        c.drawString(line_x, y, line)
-                    y -= desc_font_size + line_spacing
+                            # Don't retry the text object after a failure; later lines use drawString
+                            logger.warning("Failed to draw description with text object, falling back: %s", str(e))
+                            use_text_object = False
+                            c.setFont(desc_font_to_use, desc_font_size)
+                            c.setFillColor(_A8_DESC_GRAY)
+                    if not use_text_object:
+                        c.drawString(line_x, line_y, line)
+                y -= len(desc_lines) * desc_line_height
         
         y -= language_spacing  # Spacing between languages
+    
+    # Only flush the text object if a title or description line went into it
+    if side_text_style is not None:
+        c.drawText(side_textobj)
 
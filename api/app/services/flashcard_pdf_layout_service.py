@@ -3,7 +3,7 @@ PDF layout service for flashcard export.
 Contains functions for generating PDF layouts with multiple cards per page.
 """
 import logging
-from typing import List, Tuple
+from typing import List, NamedTuple, Tuple
 from reportlab.lib.pagesizes import A4, A5, A6, A8
 from reportlab.lib.units import mm
 from reportlab.lib.colors import HexColor
@@ -17,6 +17,21 @@ from app.services.flashcard_pdf_draw_service import (
 
 logger = logging.getLogger(__name__)
 
+# Colors (parsed once)
+_WHITE = HexColor("#FFFFFF")
+_CUT_MARK_GRAY = HexColor("#F3F3F3")  # Very light gray for subtle cutting marks
+
+# Name of the form XObject holding the A4 cutting marks
+_CUT_MARKS_FORM = "cut_marks"
+
+# Supported page formats, keyed by lowercase format string
+_PAGE_FORMATS = {
+    'a4': A4,
+    'a5': A5,
+    'a6': A6,
+    'a8': A8,
+}
+
 
 def get_page_format(format_str: str) -> Tuple[float, float]:
     """Map format string to reportlab page size tuple.
@@ -27,14 +42,82 @@ def get_page_format(format_str: str) -> Tuple[float, float]:
     Returns:
         Tuple of (width, height) in points
     """
-    format_lower = format_str.lower()
-    format_map = {
-        'a4': A4,
-        'a5': A5,
-        'a6': A6,
-        'a8': A8,
-    }
-    return format_map.get(format_lower, A6)  # Default to A6 if unknown
+    return _PAGE_FORMATS.get(format_str.lower(), A6)  # Default to A6 if unknown
+
+
+class _A4GridLayout(NamedTuple):
+    """Placement of a grid of scaled cards on an A4 page."""
+    grid_cols: int
+    grid_rows: int
+    cards_per_page: int
+    scale: float
+    scaled_card_width: float
+    scaled_card_height: float
+    margin_x: float
+    margin_y: float
+    positions_front: Tuple[Tuple[float, float], ...]
+    positions_back: Tuple[Tuple[float, float], ...]
+
+
+def _compute_a4_grid_layout(card_format: Tuple[float, float], grid_cols: int, grid_rows: int) -> _A4GridLayout:
+    """Compute scale, margins and card positions for a grid of cards on A4."""
+    a4_width, a4_height = A4
+    card_width, card_height = card_format
+    
+    # Calculate scale factor to fit cards on A4 page
+    # Leave small margins (2mm total)
+    scale_x = (a4_width - 2 * mm) / (card_width * grid_cols)
+    scale_y = (a4_height - 2 * mm) / (card_height * grid_rows)
+    scale = min(scale_x, scale_y)  # Use smaller scale to maintain aspect ratio
+    
+    # Scaled card dimensions
+    scaled_card_width = card_width * scale
+    scaled_card_height = card_height * scale
+    
+    # Calculate spacing
+    total_card_width = scaled_card_width * grid_cols
+    total_card_height = scaled_card_height * grid_rows
+    margin_x = (a4_width - total_card_width) / 2
+    margin_y = (a4_height - total_card_height) / 2
+    
+    # Generate positions for front side (left-to-right, top-to-bottom)
+    positions_front = []
+    for row in range(grid_rows):
+        for col in range(grid_cols):
+            x = margin_x + col * scaled_card_width
+            y = a4_height - margin_y - (row + 1) * scaled_card_height
+            positions_front.append((x, y))
+    
+    # Generate mirrored positions for back sides (for double-sided printing alignment)
+    # Mirror horizontally: flip columns
+    positions_back = []
+    for row in range(grid_rows):
+        for col in range(grid_cols):
+            # Mirror column: grid_cols - 1 - col
+            mirrored_col = grid_cols - 1 - col
+            x = margin_x + mirrored_col * scaled_card_width
+            y = a4_height - margin_y - (row + 1) * scaled_card_height
+            positions_back.append((x, y))
+    
+    return _A4GridLayout(
+        grid_cols=grid_cols,
+        grid_rows=grid_rows,
+        cards_per_page=grid_cols * grid_rows,
+        scale=scale,
+        scaled_card_width=scaled_card_width,
+        scaled_card_height=scaled_card_height,
+        margin_x=margin_x,
+        margin_y=margin_y,
+        positions_front=tuple(positions_front),
+        positions_back=tuple(positions_back),
+    )
+
+
+# A4 grids for the card formats that can be fitted to A4 (computed once)
+_A4_GRID_LAYOUTS = {
+    A6: _compute_a4_grid_layout(A6, 2, 2),  # 2x2 grid (4 cards per page)
+    A8: _compute_a4_grid_layout(A8, 4, 4),  # 4x4 grid (16 cards per page)
+}
 
 
 def generate_pdf_a4_layout(
@@ -78,63 +161,20 @@ def generate_pdf_a4_layout(
     """
     # A4 dimensions
     a4_width, a4_height = A4
-    card_width, card_height = card_format
     
-    # Determine grid size based on card format
-    if card_format == A6:
-        grid_cols = 2
-        grid_rows = 2
-        cards_per_page = 4
-    elif card_format == A8:
-        grid_cols = 4
-        grid_rows = 4
-        cards_per_page = 16
-    else:
-        # Default to A6 if unknown format
-        grid_cols = 2
-        grid_rows = 2
-        cards_per_page = 4
+    # Grid geometry is precomputed for the supported card formats
+    layout = _A4_GRID_LAYOUTS.get(card_format)
+    if layout is None:
+        # Default to A6 grid if unknown format
+        layout = _compute_a4_grid_layout(card_format, 2, 2)
         logger.warning("Unknown card format, defaulting to A6 (2x2 grid)")
-    
-    # Calculate scale factor to fit cards on A4 page
-    # Leave small margins (2mm total)
-    scale_x = (a4_width - 2 * mm) / (card_width * grid_cols)
-    scale_y = (a4_height - 2 * mm) / (card_height * grid_rows)
-    scale = min(scale_x, scale_y)  # Use smaller scale to maintain aspect ratio
-    
-    # Scaled card dimensions
-    scaled_card_width = card_width * scale
-    scaled_card_height = card_height * scale
-    
-    # Calculate spacing
-    total_card_width = scaled_card_width * grid_cols
-    total_card_height = scaled_card_height * grid_rows
-    margin_x = (a4_width - total_card_width) / 2
-    margin_y = (a4_height - total_card_height) / 2
-    
-    # Generate positions for front side (left-to-right, top-to-bottom)
-    positions_front = []
-    for row in range(grid_rows):
-        for col in range(grid_cols):
-            x = margin_x + col * scaled_card_width
-            y = a4_height - margin_y - (row + 1) * scaled_card_height
-            positions_front.append((x, y))
-    
-    # Generate mirrored positions for back sides (for double-sided printing alignment)
-    # Mirror horizontally: flip columns
-    positions_back = []
-    for row in range(grid_rows):
-        for col in range(grid_cols):
-            # Mirror column: grid_cols - 1 - col
-            mirrored_col = grid_cols - 1 - col
-            x = margin_x + mirrored_col * scaled_card_width
-            y = a4_height - margin_y - (row + 1) * scaled_card_height
-            positions_back.append((x, y))
+    (grid_cols, grid_rows, cards_per_page, scale, scaled_card_width, scaled_card_height,
+     margin_x, margin_y, positions_front, positions_back) = layout
     
     def draw_cutting_lines(canvas_obj, page_width, page_height, card_width, card_height, margin_x, margin_y, cols, rows):
         """Draw tiny cutting marks at edges and crosses at crosspoints."""
         # Use a very light gray color for subtle cutting marks
-        canvas_obj.setStrokeColor(HexColor("#F3F3F3"))
+        canvas_obj.setStrokeColor(_CUT_MARK_GRAY)
         canvas_obj.setLineWidth(0.5)  # Very thin line
         
         # Mark length: few mm (3mm)
@@ -174,18 +214,26 @@ def generate_pdf_a4_layout(
                     cross_x, cross_y + cross_arm_length
                 )
     
+    # The cutting marks are the same on every page: record them once as a form XObject
+    c.beginForm(_CUT_MARKS_FORM)
+    draw_cutting_lines(c, a4_width, a4_height, scaled_card_width, scaled_card_height, margin_x, margin_y, grid_cols, grid_rows)
+    c.endForm()
+    
     # For A6 and A8 formats, add empty front and back pages at the start
     if card_format == A6 or card_format == A8:
         # Empty front page
-        c.setFillColor(HexColor("#FFFFFF"))
+        c.setFillColor(_WHITE)
         c.rect(0, 0, a4_width, a4_height, fill=1, stroke=0)
         c.showPage()
         
         # Empty back page
-        c.setFillColor(HexColor("#FFFFFF"))
+        c.setFillColor(_WHITE)
         c.rect(0, 0, a4_width, a4_height, fill=1, stroke=0)
         c.showPage()
     
+    # Use A8 landscape drawing function for A8 cards, regular drawing for A6
+    draw_side = draw_card_side_a8_landscape if card_format == A8 else draw_card_side
+    
     # Process concepts in groups
     total_cards_drawn = 0
     for group_start in range(0, len(concepts), cards_per_page):
@@ -196,11 +244,9 @@ def generate_pdf_a4_layout(
         logger.info("Processing group %d: %d concepts (indices %d-%d)", 
                    group_num, len(group_concepts), group_start, group_start + len(group_concepts) - 1)
         
-        # Initialize front page with white background
+        # Start a new front page (pages are white by default, no background fill needed)
         if group_start > 0:
             c.showPage()
-        c.setFillColor(HexColor("#FFFFFF"))
-        c.rect(0, 0, a4_width, a4_height, fill=1, stroke=0)
         
         # Draw front sides for this group
         for card_in_group, (concept, lemmas, topic) in enumerate(group_concepts):
@@ -209,41 +255,26 @@ def generate_pdf_a4_layout(
             
             logger.debug("Drawing front of concept %d at position %d in group", concept.id, card_in_group)
             
-            # Save state, translate and scale, draw card, restore
+            # Save state, translate and scale (one matrix), draw card, restore
             c.saveState()
-            c.translate(offset_x, offset_y)
-            c.scale(scale, scale)
-            # Use A8 landscape drawing function for A8 cards, regular drawing for A6
-            if card_format == A8:
-                draw_card_side_a8_landscape(
-                    c, concept, lemmas, languages_front, topic,
-                    offset_x=0, offset_y=0,
-                    include_image=include_image_front,
-                    include_title=include_text_front,
-                    include_ipa=include_ipa_front,
-                    include_description=include_description_front,
-                    page_size=card_format,
-                )
-            else:
-                draw_card_side(
-                    c, concept, lemmas, languages_front, topic,
-                    offset_x=0, offset_y=0,
-                    include_image=include_image_front,
-                    include_title=include_text_front,
-                    include_ipa=include_ipa_front,
-                    include_description=include_description_front,
-                    page_size=card_format,
-                )
+            c.transform(scale, 0, 0, scale, offset_x, offset_y)
+            draw_side(
+                c, concept, lemmas, languages_front, topic,
+                offset_x=0, offset_y=0,
+                include_image=include_image_front,
+                include_title=include_text_front,
+                include_ipa=include_ipa_front,
+                include_description=include_description_front,
+                page_size=card_format,
+            )
             c.restoreState()
             total_cards_drawn += 1
         
         # Draw cutting lines on front page
-        draw_cutting_lines(c, a4_width, a4_height, scaled_card_width, scaled_card_height, margin_x, margin_y, grid_cols, grid_rows)
+        c.doForm(_CUT_MARKS_FORM)
         
         # Create back page for this group
         c.showPage()
-        c.setFillColor(HexColor("#FFFFFF"))
-        c.rect(0, 0, a4_width, a4_height, fill=1, stroke=0)
         
         # Draw back sides for this group (mirrored positions)
         for card_in_group, (concept, lemmas, topic) in enumerate(group_concepts):
@@ -252,35 +283,22 @@ def generate_pdf_a4_layout(
             
             logger.debug("Drawing back of concept %d at position %d in group", concept.id, card_in_group)
             
-            # Save state, translate and scale, draw card, restore
+            # Save state, translate and scale (one matrix), draw card, restore
             c.saveState()
-            c.translate(offset_x, offset_y)
-            c.scale(scale, scale)
-            # Use A8 landscape drawing function for A8 cards, regular drawing for A6
-            if card_format == A8:
-                draw_card_side_a8_landscape(
-                    c, concept, lemmas, languages_back, topic,
-                    offset_x=0, offset_y=0,
-                    include_image=include_image_back,
-                    include_title=include_text_back,
-                    include_ipa=include_ipa_back,
-                    include_description=include_description_back,
-                    page_size=card_format,
-                )
-            else:
-                draw_card_side(
-                    c, concept, lemmas, languages_back, topic,
-                    offset_x=0, offset_y=0,
-                    include_image=include_image_back,
-                    include_title=include_text_back,
-                    include_ipa=include_ipa_back,
-                    include_description=include_description_back,
-                    page_size=card_format,
-                )
+            c.transform(scale, 0, 0, scale, offset_x, offset_y)
+            draw_side(
+                c, concept, lemmas, languages_back, topic,
+                offset_x=0, offset_y=0,
+                include_image=include_image_back,
+                include_title=include_text_back,
+                include_ipa=include_ipa_back,
+                include_description=include_description_back,
+                page_size=card_format,
+            )
             c.restoreState()
         
         # Draw cutting lines on back page
-        draw_cutting_lines(c, a4_width, a4_height, scaled_card_width, scaled_card_height, margin_x, margin_y, grid_cols, grid_rows)
+        c.doForm(_CUT_MARKS_FORM)
     
     logger.info("Finished exporting: %d cards drawn from %d concepts", total_cards_drawn, len(concepts))
     return total_cards_drawn
@@ -330,12 +348,12 @@ def generate_pdf(
     # For A6 and A8 formats, add empty front and back pages at the start
     if page_format == A6 or page_format == A8:
         # Empty front page
-        c.setFillColor(HexColor("#FFFFFF"))
+        c.setFillColor(_WHITE)
         c.rect(0, 0, page_width, page_height, fill=1, stroke=0)
         c.showPage()
         
         # Empty back page
-        c.setFillColor(HexColor("#FFFFFF"))
+        c.setFillColor(_WHITE)
         c.rect(0, 0, page_width, page_height, fill=1, stroke=0)
         c.showPage()
     
@@ -347,9 +365,7 @@ def generate_pdf(
         if concept_idx > 0:
             c.showPage()
         
-        c.setFillColor(HexColor("#FFFFFF"))
-        c.rect(0, 0, page_width, page_height, fill=1, stroke=0)
-        
+        # No page or card fill needed: the card is the whole page, which is white by default
         logger.debug("Drawing front of concept %d", concept.id)
         
         draw_card_side(
@@ -360,13 +376,12 @@ def generate_pdf(
             include_ipa=include_ipa_front,
             include_description=include_description_front,
             page_size=page_format,
+            clear_background=False,
         )
         total_cards_drawn += 1
         
         # Back page
         c.showPage()
-        c.setFillColor(HexColor("#FFFFFF"))
-        c.rect(0, 0, page_width, page_height, fill=1, stroke=0)
         
         logger.debug("Drawing back of concept %d", concept.id)
         
@@ -378,6 +393,7 @@ def generate_pdf(
             include_ipa=include_ipa_back,
             include_description=include_description_back,
             page_size=page_format,
+            clear_background=False,
         )
     
     logger.info("Finished exporting: %d cards drawn from %d concepts", total_cards_drawn, len(concepts))
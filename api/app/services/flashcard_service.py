@@ -4,10 +4,17 @@ Flashcard service for PDF export utilities.
 import logging
 import os
 import html
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
-from typing import Optional
+from typing import Generic, Hashable, Iterable, Optional, Tuple, TypeVar
 import requests
+from requests.adapters import HTTPAdapter
 from PIL import Image, ImageDraw
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
@@ -29,6 +36,31 @@ _title_font_name = "Helvetica-Bold"
 _description_font_name = "Helvetica"
 _ipa_font_name = None
 
+# Remote images kept in memory (by count, total size and age), and threads used to prefetch them for an export
+_REMOTE_IMAGE_CACHE_SIZE = 64
+_REMOTE_IMAGE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+_REMOTE_IMAGE_CACHE_TTL_SECONDS = 10 * 60
+_IMAGE_PREFETCH_WORKERS = 8
+# Exports that can draw at once: FastAPI runs sync endpoints in anyio's threadpool (40 threads by default)
+_MAX_CONCURRENT_EXPORTS = 40
+
+# Local image files kept in memory (by count and total size)
+_LOCAL_IMAGE_CACHE_SIZE = 64
+_LOCAL_IMAGE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+# Prefetch threads are shared by all exports, so concurrent exports don't each start their own
+_image_prefetch_executor = ThreadPoolExecutor(max_workers=_IMAGE_PREFETCH_WORKERS, thread_name_prefix="image-prefetch")
+
+# One keep-alive connection pool for image downloads, sized for the prefetch threads plus
+# every export thread downloading an image on demand while drawing
+_http_session = requests.Session()
+_http_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=_IMAGE_PREFETCH_WORKERS + _MAX_CONCURRENT_EXPORTS)
+_http_session.mount("http://", _http_adapter)
+_http_session.mount("https://", _http_adapter)
+
+# Arabic script blocks: Arabic, Arabic Supplement, Arabic Extended-A and Presentation Forms-A/B
+_ARABIC_CHAR_PATTERN = re.compile("[\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF\uFB50-\uFDFF\uFE70-\uFEFC]")
+
 
 # ============================================================================
 # Font Utilities
@@ -67,39 +99,67 @@ def _build_font_search_paths():
     return search_paths
 
 
+def _scan_font_dir(directory: str, ttf_files: list, otf_files: list) -> None:
+    """Collect .ttf/.otf files under a directory, depth-first, in a single scandir pass per directory."""
+    try:
+        with os.scandir(directory) as entries_it:
+            entries = list(entries_it)
+    except (PermissionError, FileNotFoundError, NotADirectoryError):
+        return
+    for entry in entries:
+        if entry.name.endswith('.ttf'):
+            if entry.is_file():
+                ttf_files.append(Path(entry.path))
+        elif entry.name.endswith('.otf'):
+            if entry.is_file():
+                otf_files.append(Path(entry.path))
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir(follow_symlinks=False)
+        except OSError:
+            continue
+        if is_dir:
+            _scan_font_dir(entry.path, ttf_files, otf_files)
+
+
+@lru_cache(maxsize=32)
+def _list_font_files(search_path: str) -> Tuple[Tuple[Path, str], ...]:
+    """List (font file, extension) pairs under a search path (walked once per process)."""
+    if not os.path.exists(search_path):
+        return ()
+    # Search for .ttf and .otf files (NOT .ttc - TTFont doesn't support TrueType Collections)
+    ttf_files, otf_files = [], []
+    _scan_font_dir(search_path, ttf_files, otf_files)
+    return tuple((font_file, '.ttf') for font_file in ttf_files) + tuple((font_file, '.otf') for font_file in otf_files)
+
+
 def find_font_files(search_paths, patterns):
     """Find font files matching patterns in search paths."""
     import fnmatch
     found_fonts = []
     for search_path in search_paths:
-        if not os.path.exists(search_path):
-            continue
-        path_obj = Path(search_path)
-        # Search for .ttf and .otf files (NOT .ttc - TTFont doesn't support TrueType Collections)
-        for ext in ['.ttf', '.otf']:
-            for font_file in path_obj.rglob(f'*{ext}'):
-                if font_file.is_file():
-                    font_name = font_file.name
-                    # Check if font name matches any pattern
-                    for pattern in patterns:
-                        # Handle wildcard patterns
-                        if '*' in pattern:
-                            # Use fnmatch for wildcard matching (font_name already has extension)
-                            # Try pattern with extension, pattern with wildcard+extension, or just pattern
-                            # Also try pattern without extension (since font_name includes extension)
-                            font_name_no_ext = font_name.rsplit('.', 1)[0] if '.' in font_name else font_name
-                            if (fnmatch.fnmatch(font_name, pattern + ext) or 
-                                fnmatch.fnmatch(font_name, pattern + '*' + ext) or 
-                                fnmatch.fnmatch(font_name, pattern + ext.replace('.', '')) or
-                                fnmatch.fnmatch(font_name, pattern) or
-                                fnmatch.fnmatch(font_name_no_ext, pattern.rstrip('*'))):
-                                found_fonts.append(str(font_file))
-                                break
-                        else:
-                            # Simple substring match (case-insensitive)
-                            if pattern.lower() in font_name.lower():
-                                found_fonts.append(str(font_file))
-                                break
+        for font_file, ext in _list_font_files(search_path):
+            font_name = font_file.name
+            # Check if font name matches any pattern
+            for pattern in patterns:
+                # Handle wildcard patterns
+                if '*' in pattern:
+                    # Use fnmatch for wildcard matching (font_name already has extension)
+                    # Try pattern with extension, pattern with wildcard+extension, or just pattern
+                    # Also try pattern without extension (since font_name includes extension)
+                    font_name_no_ext = font_name.rsplit('.', 1)[0] if '.' in font_name else font_name
+                    if (fnmatch.fnmatch(font_name, pattern + ext) or 
+                        fnmatch.fnmatch(font_name, pattern + '*' + ext) or 
+                        fnmatch.fnmatch(font_name, pattern + ext.replace('.', '')) or
+                        fnmatch.fnmatch(font_name, pattern) or
+                        fnmatch.fnmatch(font_name_no_ext, pattern.rstrip('*'))):
+                        found_fonts.append(str(font_file))
+                        break
+                else:
+                    # Simple substring match (case-insensitive)
+                    if pattern.lower() in font_name.lower():
+                        found_fonts.append(str(font_file))
+                        break
     return found_fonts
 
 
@@ -159,8 +219,7 @@ def register_unicode_fonts():
                 break
             except Exception as e:
                 logger.warning("Failed to register Arabic font %s: %s", font_path, str(e))
-                import traceback
-                logger.debug("Traceback: %s", traceback.format_exc())
+                logger.debug("Traceback:", exc_info=True)
                 continue
     
     if _unicode_font_registered:
@@ -377,6 +436,7 @@ def register_flashcard_fonts():
 # Text Utilities
 # ============================================================================
 
+@lru_cache(maxsize=4096)
 def decode_html_entities(text: str) -> str:
     """Decode HTML entities in text."""
     if not text:
@@ -386,10 +446,10 @@ def decode_html_entities(text: str) -> str:
 
 def contains_arabic_characters(text: str) -> bool:
     """Check if text contains Arabic characters."""
-    if not text:
+    # Pure ASCII text (the common case) cannot contain Arabic; isascii() is a single C-level check
+    if not text or text.isascii():
         return False
-    # Arabic Unicode range: U+0600 to U+06FF
-    return any('\u0600' <= char <= '\u06FF' for char in text)
+    return _ARABIC_CHAR_PATTERN.search(text) is not None
 
 
 def is_arabic_language(lang_code: str) -> bool:
@@ -397,15 +457,18 @@ def is_arabic_language(lang_code: str) -> bool:
     return lang_code.lower() == 'ar'
 
 
+@lru_cache(maxsize=4096)
 def should_use_unicode_font(lang_code: str, text: str) -> bool:
     """Determine if Unicode font should be used for this text."""
     return is_arabic_language(lang_code) or contains_arabic_characters(text)
 
 
+@lru_cache(maxsize=4096)
 def process_arabic_text(text: str) -> str:
     """
     Process Arabic text for proper rendering in PDF.
     Reshapes Arabic characters and applies bidirectional text algorithm.
+    Cached, since the same lemmas are drawn on both sides of a card.
     
     Args:
         text: Arabic text to process
@@ -443,6 +506,18 @@ def process_arabic_text(text: str) -> str:
 # Image Utilities
 # ============================================================================
 
+def _asset_file_path(image_url: str) -> Path:
+    """Map an /assets/ URL to its path in the assets directory (without touching the disk)."""
+    if settings.assets_path:
+        assets_dir = Path(settings.assets_path)
+    else:
+        api_root = Path(__file__).parent.parent.parent
+        assets_dir = api_root / "assets"
+    
+    image_filename = image_url.replace("/assets/", "")
+    return assets_dir / image_filename
+
+
 def get_image_path(image_url: Optional[str]) -> Optional[Path]:
     """Get local file path for an image URL."""
     if not image_url:
@@ -450,14 +525,7 @@ def get_image_path(image_url: Optional[str]) -> Optional[Path]:
     
     # If it's a relative path starting with /assets/, get the local file
     if image_url.startswith("/assets/"):
-        if settings.assets_path:
-            assets_dir = Path(settings.assets_path)
-        else:
-            api_root = Path(__file__).parent.parent.parent
-            assets_dir = api_root / "assets"
-        
-        image_filename = image_url.replace("/assets/", "")
-        image_path = assets_dir / image_filename
+        image_path = _asset_file_path(image_url)
         if image_path.exists():
             return image_path
     
@@ -483,58 +551,171 @@ def get_language_flag_image_path(language_code: str) -> Optional[Path]:
     
     # Try each path until we find one that exists
     for flag_path in possible_paths:
-        logger.debug("Checking flag image at: %s (exists: %s)", flag_path, flag_path.exists())
         if flag_path.exists():
-            logger.info("Found flag image for %s at: %s", language_code, flag_path)
+            logger.debug("Found flag image for %s at: %s", language_code, flag_path)
             return flag_path
     
     logger.warning("Flag image not found for %s in any of the checked paths", language_code)
     return None
 
 
-def download_image(url: str) -> Optional[BytesIO]:
-    """Download an image from a URL."""
+_V = TypeVar("_V")
+
+
+class SizedLRUCache(Generic[_V]):
+    """
+    Thread-safe LRU cache bounded by entry count and total size in bytes.
+    
+    Callers pass each value's size when storing it. Values larger than the
+    whole budget are not stored. With ttl_seconds, entries older than that
+    are treated as missing.
+    """
+    
+    def __init__(self, max_entries: int, max_bytes: int, ttl_seconds: Optional[float] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        # key -> (stored at, value, size), least recently used first
+        self._entries: "OrderedDict[Hashable, Tuple[float, _V, int]]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable) -> Optional[_V]:
+        """Return the cached value for key, or None when missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self.ttl_seconds is not None and time.monotonic() - entry[0] >= self.ttl_seconds:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+    
+    def put(self, key: Hashable, value: _V, size: int) -> None:
+        """Store value under key, evicting least recently used entries to stay within bounds."""
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            stale = self._entries.pop(key, None)
+            if stale is not None:
+                self._total_bytes -= stale[2]
+            self._entries[key] = (time.monotonic(), value, size)
+            self._total_bytes += size
+            while len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes:
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self._total_bytes -= evicted_size
+
+
+_local_image_cache: SizedLRUCache[bytes] = SizedLRUCache(_LOCAL_IMAGE_CACHE_SIZE, _LOCAL_IMAGE_CACHE_MAX_BYTES)
+_remote_image_cache: SizedLRUCache[bytes] = SizedLRUCache(
+    _REMOTE_IMAGE_CACHE_SIZE, _REMOTE_IMAGE_CACHE_MAX_BYTES, _REMOTE_IMAGE_CACHE_TTL_SECONDS
+)
+
+
+def _read_image_file(path: str, mtime_ns: int) -> bytes:
+    """Read a local image file, cached. Keyed on mtime so regenerated images are picked up."""
+    cache_key = (path, mtime_ns)
+    content = _local_image_cache.get(cache_key)
+    if content is None:
+        with open(path, "rb") as f:
+            content = f.read()
+        _local_image_cache.put(cache_key, content, len(content))
+    return content
+
+
+def _fetch_remote_image(url: str) -> bytes:
+    """
+    Fetch a remote image, reusing a cached copy younger than the TTL.
+    
+    Raises on failure, so failed downloads are not cached.
+    """
+    content = _remote_image_cache.get(url)
+    if content is None:
+        # Download outside the cache lock, so prefetch threads fetch in parallel
+        response = _http_session.get(url, timeout=10)
+        response.raise_for_status()
+        content = response.content
+        _remote_image_cache.put(url, content, len(content))
+    return content
+
+
+def download_image_bytes(url: str) -> Optional[bytes]:
+    """
+    Download an image from a URL and return its raw bytes.
+    
+    Results are cached, so the front and back of a card (and cards sharing an
+    image) only read or download the image once. The returned bytes are shared.
+    """
     try:
         # Handle relative URLs
         if url.startswith("/assets/"):
-            image_path = get_image_path(url)
-            if image_path and image_path.exists():
-                with open(image_path, "rb") as f:
-                    return BytesIO(f.read())
-            return None
+            # A single stat both checks the file exists and keys the read cache on its mtime
+            image_path = str(_asset_file_path(url))
+            try:
+                mtime_ns = os.stat(image_path).st_mtime_ns
+            except OSError:
+                return None
+            return _read_image_file(image_path, mtime_ns)
         
         # Handle absolute URLs
         if url.startswith("http://") or url.startswith("https://"):
-            response = requests.get(url, timeout=10)
-            if response.status_code == 200:
-                return BytesIO(response.content)
+            return _fetch_remote_image(url)
         
+        return None
+    except requests.HTTPError:
         return None
     except Exception as e:
         logger.warning("Failed to download image from %s: %s", url, str(e))
         return None
 
 
-def apply_rounded_corners(image: Image.Image, corner_radius_px: int) -> Image.Image:
+def prefetch_images(urls: Iterable[str]) -> None:
     """
-    Apply rounded corners to a PIL Image using a mask.
+    Download remote images concurrently, so drawing finds them in the cache.
     
-    Args:
-        image: PIL Image to apply rounded corners to
-        corner_radius_px: Corner radius in pixels
-    
-    Returns:
-        PIL Image with rounded corners applied (RGBA mode)
+    Images are fetched in drawing order until the cache would be full, by
+    count or by size: fetching more would evict the first images before
+    drawing reaches them. Any others are downloaded on demand while drawing,
+    as before.
     """
-    # Convert to RGBA to support transparency for rounded corners
-    if image.mode != "RGBA":
-        image = image.convert("RGBA")
-    
-    # Ensure reasonable radius
-    corner_radius_px = max(1, min(corner_radius_px, min(image.size) // 2))
+    remote_urls = [
+        url for url in dict.fromkeys(urls)
+        if url.startswith("http://") or url.startswith("https://")
+    ][:_REMOTE_IMAGE_CACHE_SIZE]
+    if len(remote_urls) < 2:
+        return
+    
+    prefetched_bytes = 0
+    prefetched_lock = threading.Lock()
+    
+    def prefetch(url: str) -> None:
+        nonlocal prefetched_bytes
+        # Downloads already running may still finish just past the budget
+        if prefetched_bytes >= _REMOTE_IMAGE_CACHE_MAX_BYTES:
+            return
+        # download_image_bytes logs and swallows failures, so one bad URL doesn't stop the rest
+        image_bytes = download_image_bytes(url)
+        if image_bytes:
+            with prefetched_lock:
+                prefetched_bytes += len(image_bytes)
+    
+    list(_image_prefetch_executor.map(prefetch, remote_urls))
+
+
+def download_image(url: str) -> Optional[BytesIO]:
+    """Download an image from a URL."""
+    image_bytes = download_image_bytes(url)
+    return BytesIO(image_bytes) if image_bytes else None
+
+
+@lru_cache(maxsize=64)
+def _rounded_corner_mask(width: int, height: int, corner_radius_px: int) -> Image.Image:
+    """
+    Build an alpha mask with rounded corners.
     
-    # Create mask for rounded corners
-    width, height = image.size
+    Cached by (width, height, radius): an export only uses a handful of distinct
+    image and flag sizes. The returned mask is shared and must not be modified.
+    """
     mask = Image.new("L", (width, height), 0)
     draw = ImageDraw.Draw(mask)
     
@@ -573,8 +754,29 @@ def apply_rounded_corners(image: Image.Image, corner_radius_px: int) -> Image.Im
                 fill=255
             )
     
+    return mask
+
+
+def apply_rounded_corners(image: Image.Image, corner_radius_px: int) -> Image.Image:
+    """
+    Apply rounded corners to a PIL Image using a mask.
+    
+    Args:
+        image: PIL Image to apply rounded corners to
+        corner_radius_px: Corner radius in pixels
+    
+    Returns:
+        PIL Image with rounded corners applied (RGBA mode)
+    """
+    # Convert to RGBA to support transparency for rounded corners
+    if image.mode != "RGBA":
+        image = image.convert("RGBA")
+    
+    # Ensure reasonable radius
+    corner_radius_px = max(1, min(corner_radius_px, min(image.size) // 2))
+    
     # Apply mask to image alpha channel
-    image.putalpha(mask)
+    width, height = image.size
+    image.putalpha(_rounded_corner_mask(width, height, corner_radius_px))
     
     return image
-